@@ -4,13 +4,23 @@ Connects Python solvers to real-time frontend visualization
 """
 
 from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from flask_socketio import SocketIO, emit, join_room, leave_room
 import numpy as np
+import orjson
+import requests
+import base64
+import os
+import queue
+import threading
 import sys
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 import json
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 # Add src to path
 # Path: .../app/backend/app/api/enhanced_api.py -> need to go to .../src
@@ -19,22 +29,98 @@ sys.path.insert(0, str(workspace_root / 'src'))
 
 from quantum_playground.solvers import (
     QuantumGrid, StationarySolver, TimeDependentSolver,
-    GaussianWavePacket, compute_transmission_coefficient
+    GaussianWavePacket, compute_transmission_coefficient, abs2
 )
 from quantum_playground.potentials import (
     InfiniteSquareWell, FiniteSquareWell, RectangularBarrier,
     HarmonicOscillator, PotentialAnalysis
 )
 
+try:
+    from numba import njit
+except ImportError:  # numba is part of the optional "performance" extra
+    njit = None
+
+NUMBA_AVAILABLE = njit is not None
+
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _orjson_default(obj):
+    """Fallback for values orjson cannot encode natively"""
+    if isinstance(obj, np.ndarray):
+        # Complex arrays go out as separate real/imag arrays
+        if np.iscomplexobj(obj):
+            return {
+                'real': np.ascontiguousarray(obj.real),
+                'imag': np.ascontiguousarray(obj.imag)
+            }
+        # Strided views (e.g. eigenvector columns) need a contiguous copy
+        if not obj.flags.c_contiguous:
+            return np.ascontiguousarray(obj)
+    if isinstance(obj, (complex, np.complexfloating)):
+        return serialize_complex(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def orjson_dumps(obj):
+    """Encode obj to JSON bytes with numpy support"""
+    return orjson.dumps(obj, default=_orjson_default, option=ORJSON_OPTIONS)
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, so jsonify() accepts numpy arrays"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson_dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Skip the str round-trip: orjson already produces UTF-8 bytes
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson_dumps(obj), mimetype='application/json')
+
+
+class OrjsonSerializer:
+    """json-module shim so Socket.IO payloads may carry numpy arrays"""
+
+    @staticmethod
+    def dumps(obj, **kwargs):
+        return orjson_dumps(obj).decode()
+
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
-CORS(app)
-socketio = SocketIO(app, cors_allowed_origins="*")
+app.json = OrjsonProvider(app)
+# Let browsers cache the preflight for a day instead of re-sending OPTIONS
+# before every POST
+CORS(app, resources={r"/api/*": {"origins": "*", "methods": ["GET", "POST"], "max_age": 86400}})
+socketio = SocketIO(
+    app, cors_allowed_origins="*", json=OrjsonSerializer,
+    async_mode=os.environ.get('SOCKETIO_ASYNC_MODE')
+)
 
 # Configuration
 GRID_POINTS = 1000
 X_MIN = -15
 X_MAX = 15
 
+# The default grid never changes, so build it (and its JSON) once at import
+GRID = QuantumGrid(X_MIN, X_MAX, GRID_POINTS)
+GRID_INFO = {
+    'x': orjson.Fragment(orjson_dumps(GRID.x.astype(np.float32))),
+    'x_min': X_MIN,
+    'x_max': X_MAX,
+    'num_points': GRID_POINTS,
+    'dx': float(GRID.dx)
+}
+GRID_X2 = GRID.x * GRID.x
+
 # Webhook registry
 webhooks = {
     'on_simulation_complete': [],
@@ -43,6 +129,19 @@ webhooks = {
     'on_error': []
 }
 
+# Webhook deliveries are queued and posted by background workers so a slow
+# endpoint never holds up a response
+WEBHOOK_WORKERS = int(os.environ.get('WEBHOOK_WORKERS', 4))
+WEBHOOK_TIMEOUT = 5
+_webhook_q = queue.Queue()
+_webhook_workers_started = False
+_webhook_lock = threading.Lock()
+
+# Batch requests solve their simulations concurrently; LAPACK/ARPACK release
+# the GIL, so wall time is close to the slowest single solve
+BATCH_WORKERS = 4
+_batch_executor = ThreadPoolExecutor(max_workers=BATCH_WORKERS)
+
 # Connected clients
 connected_clients = {}
 
@@ -52,12 +151,93 @@ connected_clients = {}
 # ============================================================================
 
 def serialize_array(arr):
-    """Convert numpy array to list for JSON serialization"""
+    """
+    Prepare numpy array for orjson (which needs C-contiguous memory)
+
+    Solvers work in double precision, but plots cannot show more than single
+    precision, so arrays are downcast to float32/complex64 on the way out.
+    """
     if isinstance(arr, np.ndarray):
-        return arr.tolist()
+        if np.iscomplexobj(arr):
+            return np.ascontiguousarray(arr, dtype=np.complex64)
+        if arr.dtype.kind == 'f':
+            return np.ascontiguousarray(arr, dtype=np.float32)
+        return np.ascontiguousarray(arr)
     return arr
 
 
+def pack_binary(obj):
+    """Replace every numpy array in a payload with a base64 float32 buffer"""
+    if isinstance(obj, np.ndarray):
+        dtype = np.complex64 if np.iscomplexobj(obj) else np.float32
+        packed = np.ascontiguousarray(obj, dtype=dtype)
+        return {
+            'dtype': packed.dtype.name,
+            'shape': list(packed.shape),
+            'data': base64.b64encode(packed.tobytes()).decode('ascii')
+        }
+    if isinstance(obj, dict):
+        return {key: pack_binary(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [pack_binary(value) for value in obj]
+    return obj
+
+
+# Binary-format encodings of arrays that repeat across responses: the default
+# grid once at import, potentials once per (type, params)
+GRID_INFO_BINARY = {**GRID_INFO, 'x': pack_binary(GRID.x)}
+POTENTIAL_B64_CACHE_SIZE = 256
+_POTENTIAL_B64_CACHE = {}
+_potential_b64_lock = threading.Lock()
+
+
+def pack_potential(potential, num_points):
+    """Binary form of a response's potential block, reusing earlier encodings"""
+    key = (num_points,) + tuple(sorted(
+        (name, value) for name, value in potential.items() if name != 'values'
+    ))
+    with _potential_b64_lock:
+        packed = _POTENTIAL_B64_CACHE.get(key)
+    if packed is None:
+        packed = pack_binary(potential['values'])
+        with _potential_b64_lock:
+            if len(_POTENTIAL_B64_CACHE) >= POTENTIAL_B64_CACHE_SIZE:
+                del _POTENTIAL_B64_CACHE[next(iter(_POTENTIAL_B64_CACHE))]
+            _POTENTIAL_B64_CACHE[key] = packed
+    return {**potential, 'values': packed}
+
+
+def pack_response(result, grid):
+    """pack_binary for a full simulation response, with grid and potential precomputed"""
+    packed = {}
+    for key, value in result.items():
+        if key == 'grid' and value is GRID_INFO:
+            packed[key] = GRID_INFO_BINARY
+        elif key == 'potential':
+            packed[key] = pack_potential(value, grid.num_points)
+        else:
+            packed[key] = pack_binary(value)
+    return packed
+
+
+def state_rows(wavefunctions):
+    """
+    Per-state arrays for the stationary responses, one pass over all states
+
+    Takes eigenvectors as columns (N, K) and returns contiguous (K, N) rows,
+    so each state's psi / real / imag / |psi|² is a view, not a fresh copy.
+    """
+    prob = abs2(wavefunctions)
+    return {
+        'psi': serialize_array(wavefunctions.T),
+        'real': serialize_array(np.real(wavefunctions).T),
+        'imag': serialize_array(np.imag(wavefunctions).T),
+        'prob': serialize_array(prob.T),
+        'prob_max': prob.max(axis=0),
+        'prob_min': prob.min(axis=0)
+    }
+
+
 def serialize_complex(z):
     """Convert complex number for JSON"""
     if isinstance(z, (complex, np.complexfloating)):
@@ -65,40 +245,224 @@ def serialize_complex(z):
     return float(z)
 
 
-def calculate_statistics(x, psi, dx):
-    """Calculate quantum statistics"""
-    prob = np.abs(psi) ** 2
-    
-    # Normalize probability
-    prob_norm = prob / (np.sum(prob) * dx + 1e-10)
-    
-    # Expected values
-    exp_x = np.sum(x * prob_norm) * dx
-    exp_x2 = np.sum(x**2 * prob_norm) * dx
+STAT_FIELDS = (
+    'expectation_x', 'expectation_x2', 'uncertainty_x',
+    'max_probability', 'min_probability', 'mean_probability',
+    'integral_probability'
+)
+
+
+def _stats_kernel(x, x2, prob, dx):
+    """
+    All STAT_FIELDS for every column of prob in a single sweep.
+
+    Compiled with numba when available; rows are walked in memory order and
+    each state keeps its own running sums, moments and extrema.
+    """
+    n, k = prob.shape
+    total = np.zeros(k)
+    sum_x = np.zeros(k)
+    sum_x2 = np.zeros(k)
+    p_max = prob[0].copy()
+    p_min = prob[0].copy()
+    for i in range(n):
+        xi = x[i]
+        x2i = x2[i]
+        for j in range(k):
+            p = prob[i, j]
+            total[j] += p
+            sum_x[j] += xi * p
+            sum_x2[j] += x2i * p
+            if p > p_max[j]:
+                p_max[j] = p
+            if p < p_min[j]:
+                p_min[j] = p
+    out = np.empty((len(STAT_FIELDS), k))
+    for j in range(k):
+        norm = total[j] * dx + 1e-10
+        exp_x = sum_x[j] * dx / norm
+        exp_x2 = sum_x2[j] * dx / norm
+        out[0, j] = exp_x
+        out[1, j] = exp_x2
+        out[2, j] = np.sqrt(abs(exp_x2 - exp_x * exp_x))
+        out[3, j] = p_max[j] / norm
+        out[4, j] = p_min[j] / norm
+        out[5, j] = total[j] / n / norm
+        out[6, j] = total[j] * dx / norm
+    return out
+
+
+if NUMBA_AVAILABLE:
+    _stats_kernel = njit(cache=True)(_stats_kernel)
+
+
+def calculate_statistics_batched(x, psi_matrix, dx, x2=None):
+    """Calculate quantum statistics for every state (column) at once"""
+    prob = abs2(psi_matrix)
+    if x2 is None:
+        x2 = x * x
     
-    # Uncertainties
-    delta_x = np.sqrt(np.abs(exp_x2 - exp_x**2))
+    if NUMBA_AVAILABLE:
+        columns = dict(zip(STAT_FIELDS, _stats_kernel(x, x2, np.ascontiguousarray(prob), dx)))
+    else:
+        # Normalize probability, column by column
+        prob_norm = prob / (prob.sum(axis=0) * dx + 1e-10)
+        
+        # Expected values as two matrix-vector products over all states
+        exp_x = (x @ prob_norm) * dx
+        exp_x2 = (x2 @ prob_norm) * dx
+        
+        # Uncertainties
+        delta_x = np.sqrt(np.abs(exp_x2 - exp_x**2))
+        
+        columns = {
+            'expectation_x': exp_x,
+            'expectation_x2': exp_x2,
+            'uncertainty_x': delta_x,
+            'max_probability': prob_norm.max(axis=0),
+            'min_probability': prob_norm.min(axis=0),
+            'mean_probability': prob_norm.mean(axis=0),
+            'integral_probability': prob_norm.sum(axis=0) * dx
+        }
     
-    return {
-        'expectation_x': float(exp_x),
-        'expectation_x2': float(exp_x2),
-        'uncertainty_x': float(delta_x),
-        'max_probability': float(np.max(prob_norm)),
-        'min_probability': float(np.min(prob_norm)),
-        'mean_probability': float(np.mean(prob_norm)),
-        'integral_probability': float(np.sum(prob_norm) * dx)
-    }
+    columns = {key: values.tolist() for key, values in columns.items()}
+    return [
+        {key: values[i] for key, values in columns.items()}
+        for i in range(prob.shape[1])
+    ]
+
+
+def _webhook_worker():
+    """Post queued webhook payloads until the process exits"""
+    session = requests.Session()
+    while True:
+        webhook_url, body = _webhook_q.get()
+        try:
+            session.post(
+                webhook_url, data=body,
+                headers={'Content-Type': 'application/json'}, timeout=WEBHOOK_TIMEOUT
+            )
+        except Exception as e:
+            print(f"Webhook error: {e}")
+        finally:
+            _webhook_q.task_done()
+
+
+def _ensure_webhook_workers():
+    """Spawn the webhook worker pool on first use"""
+    global _webhook_workers_started
+    if _webhook_workers_started:
+        return
+    with _webhook_lock:
+        if not _webhook_workers_started:
+            for _ in range(WEBHOOK_WORKERS):
+                socketio.start_background_task(_webhook_worker)
+            _webhook_workers_started = True
 
 
 def emit_to_webhooks(event_type, data):
-    """Trigger webhooks for given event type"""
-    if event_type in webhooks:
+    """Queue webhook deliveries for given event type"""
+    if event_type in webhooks and webhooks[event_type]:
+        _ensure_webhook_workers()
+        body = orjson_dumps(data)
         for webhook_url in webhooks[event_type]:
-            try:
-                import requests
-                requests.post(webhook_url, json=data, timeout=5)
-            except Exception as e:
-                print(f"Webhook error: {e}")
+            _webhook_q.put((webhook_url, body))
+
+
+def grid_x2(grid):
+    """x² for a grid; the default grid's is computed once at import"""
+    return GRID_X2 if grid is GRID else grid.x * grid.x
+
+
+def grid_payload(grid):
+    """Grid description for a response; the default grid is pre-encoded"""
+    if grid is GRID:
+        return GRID_INFO
+    return {
+        'x': serialize_array(grid.x),
+        'x_min': grid.x_min,
+        'x_max': grid.x_max,
+        'num_points': grid.num_points,
+        'dx': float(grid.dx)
+    }
+
+
+def quantize(value, digits=6):
+    """Round a float parameter so near-identical slider values share a cache entry"""
+    return round(float(value), digits)
+
+
+# ============================================================================
+# CACHED SOLVERS
+# ============================================================================
+# Eigendecompositions are keyed on the physical parameters plus the grid size,
+# so repeated requests with identical parameters skip the Hamiltonian build
+# and the eigensolve entirely. Entries hold numpy arrays, not JSON; potentials
+# are stored already downcast for the response, so hits reuse them as-is.
+
+def _freeze(*arrays):
+    """Mark cached arrays read-only so no request can mutate a shared entry"""
+    for arr in arrays:
+        arr.setflags(write=False)
+    return arrays
+
+
+@lru_cache(maxsize=8)
+def _cached_grid(num_points):
+    """Spatial grid over [X_MIN, X_MAX]; the default size reuses GRID"""
+    if num_points == GRID_POINTS:
+        return GRID
+    return QuantumGrid(X_MIN, X_MAX, num_points)
+
+
+@lru_cache(maxsize=128)
+def _cached_infinite_well(width, num_states, num_points=GRID_POINTS):
+    """Potential (float32, as served), energies and eigenstates of the infinite well"""
+    grid = _cached_grid(num_points)
+    V = InfiniteSquareWell(width)(grid.x)
+    solver = StationarySolver(grid, mass=1.0)
+    energies, wavefunctions = solver.solve_eigenproblem(V, num_eigenvalues=num_states)
+    return _freeze(serialize_array(V), energies, wavefunctions)
+
+
+@lru_cache(maxsize=128)
+def _cached_finite_well(width, height, num_states, num_points=GRID_POINTS):
+    """Potential (float32, as served), energies and eigenstates of the finite well"""
+    grid = _cached_grid(num_points)
+    V = FiniteSquareWell(width, height)(grid.x)
+    solver = StationarySolver(grid, mass=1.0)
+    energies, wavefunctions = solver.solve_eigenproblem(V, num_eigenvalues=num_states)
+    return _freeze(serialize_array(V), energies, wavefunctions)
+
+
+@lru_cache(maxsize=128)
+def _cached_harmonic(mass, omega, num_states, num_points=GRID_POINTS):
+    """Potential (float32, as served), energies and eigenstates of the harmonic oscillator"""
+    grid = _cached_grid(num_points)
+    V = HarmonicOscillator(mass, omega)(grid.x)
+    solver = StationarySolver(grid, mass=mass)
+    energies, wavefunctions = solver.solve_eigenproblem(V, num_eigenvalues=num_states)
+    return _freeze(serialize_array(V), energies, wavefunctions)
+
+
+@lru_cache(maxsize=128)
+def _cached_barrier(barrier_height, barrier_width, num_points=GRID_POINTS):
+    """
+    Centred rectangular barrier, shared by the solver and the WKB estimate
+
+    Returns the float64 potential and its float32 form as served.
+    """
+    grid = _cached_grid(num_points)
+    V = RectangularBarrier(barrier_height, barrier_width, center=0.0)(grid.x)
+    return _freeze(V, serialize_array(V))
+
+
+@lru_cache(maxsize=4096)
+def _cached_wkb_transmission(barrier_height, barrier_width, particle_energy, num_points=GRID_POINTS):
+    """WKB transmission estimate through a centred rectangular barrier"""
+    grid = _cached_grid(num_points)
+    V, _ = _cached_barrier(barrier_height, barrier_width, num_points)
+    return float(PotentialAnalysis.tunneling_probability_estimate(particle_energy, V, grid.x))
 
 
 # ============================================================================
@@ -162,7 +526,13 @@ def health_check():
 
 @app.route('/api/full-simulation', methods=['POST'])
 def full_simulation():
-    """Complete simulation with all visualization data"""
+    """
+    Complete simulation with all visualization data
+
+    With "async": true (or ?async=1) the request returns 202 and a job_id
+    immediately; the result is solved and emitted as 'simulation_complete'
+    to the simulation's room by a background task.
+    """
     try:
         data = request.get_json()
         sim_type = data.get('type', 'infinite-well')
@@ -170,23 +540,22 @@ def full_simulation():
         # Get parameters
         params = data.get('parameters', {})
         
-        # Create grid
-        grid = QuantumGrid(X_MIN, X_MAX, GRID_POINTS)
-        
-        if sim_type == 'infinite-well':
-            result = solve_infinite_well_full(grid, params)
-        elif sim_type == 'finite-well':
-            result = solve_finite_well_full(grid, params)
-        elif sim_type == 'tunneling':
-            result = solve_tunneling_full(grid, params)
-        elif sim_type == 'harmonic':
-            result = solve_harmonic_full(grid, params)
-        else:
+        if sim_type not in SOLVERS:
             raise ValueError(f"Unknown simulation type: {sim_type}")
         
-        # Emit to WebSocket clients
-        socketio.emit('simulation_complete', result, room=sim_type)
-        emit_to_webhooks('on_simulation_complete', result)
+        if data.get('async') or request.args.get('async'):
+            job_id = uuid.uuid4().hex
+            socketio.start_background_task(run_and_emit, job_id, sim_type, params)
+            return jsonify({'job_id': job_id, 'status': 'accepted', 'room': sim_type}), 202
+        
+        result = SOLVERS[sim_type](GRID, params)
+        
+        # Fan out to WebSocket clients and webhooks off the request thread
+        socketio.start_background_task(broadcast_result, sim_type, result)
+        
+        # ?format=binary packs arrays as base64 float32 (decode with Float32Array)
+        if request.args.get('format') == 'binary':
+            result = pack_response(result, GRID)
         
         return jsonify(result)
     
@@ -196,31 +565,100 @@ def full_simulation():
         return jsonify(error_data), 400
 
 
+@app.route('/api/full-simulation-batch', methods=['POST'])
+def full_simulation_batch():
+    """
+    Several complete simulations in one request, solved in parallel
+
+    Takes {"simulations": [{"type": ..., "parameters": {...}}, ...]} and
+    returns {"results": [...]} in the same order. A simulation that fails
+    gets an {"error": ...} entry instead of failing the whole batch.
+    """
+    try:
+        data = request.get_json()
+        simulations = data.get('simulations') if isinstance(data, dict) else None
+        if not isinstance(simulations, list) or not simulations:
+            raise ValueError("'simulations' must be a non-empty list")
+        
+        for sim in simulations:
+            if not isinstance(sim, dict):
+                raise ValueError("Each simulation must be an object")
+            if sim.get('type', 'infinite-well') not in SOLVERS:
+                raise ValueError(f"Unknown simulation type: {sim.get('type')}")
+        
+        futures = [
+            _batch_executor.submit(
+                SOLVERS[sim.get('type', 'infinite-well')], GRID, sim.get('parameters', {})
+            )
+            for sim in simulations
+        ]
+        
+        binary = request.args.get('format') == 'binary'
+        results = []
+        for sim, future in zip(simulations, futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                error_data = {'error': str(e), 'timestamp': datetime.now().isoformat()}
+                emit_to_webhooks('on_error', error_data)
+                results.append(error_data)
+                continue
+            socketio.start_background_task(broadcast_result, sim.get('type', 'infinite-well'), result)
+            results.append(pack_response(result, GRID) if binary else result)
+        
+        return jsonify({'results': results})
+    
+    except Exception as e:
+        error_data = {'error': str(e), 'timestamp': datetime.now().isoformat()}
+        emit_to_webhooks('on_error', error_data)
+        return jsonify(error_data), 400
+
+
+def broadcast_result(sim_type, result):
+    """Emit a finished simulation to its room and registered webhooks"""
+    socketio.emit('simulation_complete', result, room=sim_type)
+    emit_to_webhooks('on_simulation_complete', result)
+
+
+def run_and_emit(job_id, sim_type, params):
+    """Background job: solve, then deliver the result over Socket.IO"""
+    try:
+        result = SOLVERS[sim_type](GRID, params)
+    except Exception as e:
+        error_data = {
+            'job_id': job_id,
+            'error': str(e),
+            'timestamp': datetime.now().isoformat()
+        }
+        socketio.emit('simulation_error', error_data, room=sim_type)
+        emit_to_webhooks('on_error', error_data)
+        return
+    result['job_id'] = job_id
+    broadcast_result(sim_type, result)
+
+
 def solve_infinite_well_full(grid, params):
     """Complete infinite well visualization data"""
-    width = float(params.get('width', 5.0))
+    width = quantize(params.get('width', 5.0))
     num_states = int(params.get('num_states', 5))
     
-    # Solve
-    potential = InfiniteSquareWell(width)
-    solver = StationarySolver(grid, mass=1.0)
-    energies, wavefunctions = solver.solve_eigenproblem(
-        potential(grid.x), num_eigenvalues=num_states
-    )
+    # Solve (cached on parameters)
+    V, energies, wavefunctions = _cached_infinite_well(width, num_states, grid.num_points)
+    rows = state_rows(wavefunctions)
+    stats = calculate_statistics_batched(grid.x, wavefunctions, grid.dx, grid_x2(grid))
+    
+    # E_n = n²π²/(2L²), evaluated once for all states
+    n = np.arange(1, num_states + 1)
+    analytical_energies = n**2 * (np.pi**2 / (2 * width**2))
+    errors = np.abs(energies[:num_states] - analytical_energies)
     
     # Build complete response
     response = {
         'simulation_type': 'infinite-well',
         'timestamp': datetime.now().isoformat(),
-        'grid': {
-            'x': serialize_array(grid.x),
-            'x_min': X_MIN,
-            'x_max': X_MAX,
-            'num_points': GRID_POINTS,
-            'dx': float(grid.dx)
-        },
+        'grid': grid_payload(grid),
         'potential': {
-            'values': serialize_array(potential(grid.x)),
+            'values': V,
             'type': 'infinite_square_well',
             'width': width
         },
@@ -233,9 +671,9 @@ def solve_infinite_well_full(grid, params):
         'wavefunctions': [
             {
                 'state': i + 1,
-                'psi': serialize_array(wavefunctions[:, i]),
-                'psi_real': serialize_array(np.real(wavefunctions[:, i])),
-                'psi_imag': serialize_array(np.imag(wavefunctions[:, i])),
+                'psi': rows['psi'][i],
+                'psi_real': rows['real'][i],
+                'psi_imag': rows['imag'][i],
                 'energy': float(energies[i])
             }
             for i in range(num_states)
@@ -243,16 +681,16 @@ def solve_infinite_well_full(grid, params):
         'probability_densities': [
             {
                 'state': i + 1,
-                'values': serialize_array(np.abs(wavefunctions[:, i])**2),
-                'max': float(np.max(np.abs(wavefunctions[:, i])**2)),
-                'min': float(np.min(np.abs(wavefunctions[:, i])**2))
+                'values': rows['prob'][i],
+                'max': float(rows['prob_max'][i]),
+                'min': float(rows['prob_min'][i])
             }
             for i in range(num_states)
         ],
         'statistics': [
             {
                 'state': i + 1,
-                **calculate_statistics(grid.x, wavefunctions[:, i], grid.dx)
+                **stats[i]
             }
             for i in range(num_states)
         ],
@@ -260,8 +698,8 @@ def solve_infinite_well_full(grid, params):
             {
                 'state': i + 1,
                 'numerical_energy': float(energies[i]),
-                'analytical_energy': float((i+1)**2 * np.pi**2 / (2 * width**2)),
-                'error': float(abs(energies[i] - (i+1)**2 * np.pi**2 / (2 * width**2)))
+                'analytical_energy': float(analytical_energies[i]),
+                'error': float(errors[i])
             }
             for i in range(num_states)
         ]
@@ -273,31 +711,26 @@ def solve_infinite_well_full(grid, params):
 
 def solve_finite_well_full(grid, params):
     """Complete finite well visualization data"""
-    width = float(params.get('width', 5.0))
-    height = float(params.get('height', 50.0))
+    width = quantize(params.get('width', 5.0))
+    height = quantize(params.get('height', 50.0))
     num_states = int(params.get('num_states', 5))
     
-    potential = FiniteSquareWell(width, height)
-    solver = StationarySolver(grid, mass=1.0)
-    energies, wavefunctions = solver.solve_eigenproblem(
-        potential(grid.x), num_eigenvalues=num_states
+    V_array, energies, wavefunctions = _cached_finite_well(
+        width, height, num_states, grid.num_points
     )
+    rows = state_rows(wavefunctions)
+    stats = calculate_statistics_batched(grid.x, wavefunctions, grid.dx, grid_x2(grid))
+    # Probability in the last 100 grid points (right forbidden region), all states at once
+    penetration = abs2(wavefunctions[-100:, :]).sum(axis=0) * grid.dx
     
     bound_states = int(np.sum(energies < height))
-    V_array = potential(grid.x)
     
     response = {
         'simulation_type': 'finite-well',
         'timestamp': datetime.now().isoformat(),
-        'grid': {
-            'x': serialize_array(grid.x),
-            'x_min': X_MIN,
-            'x_max': X_MAX,
-            'num_points': GRID_POINTS,
-            'dx': float(grid.dx)
-        },
+        'grid': grid_payload(grid),
         'potential': {
-            'values': serialize_array(V_array),
+            'values': V_array,
             'type': 'finite_square_well',
             'width': width,
             'height': height
@@ -312,9 +745,9 @@ def solve_finite_well_full(grid, params):
         'wavefunctions': [
             {
                 'state': i + 1,
-                'psi': serialize_array(wavefunctions[:, i]),
-                'psi_real': serialize_array(np.real(wavefunctions[:, i])),
-                'psi_imag': serialize_array(np.imag(wavefunctions[:, i])),
+                'psi': rows['psi'][i],
+                'psi_real': rows['real'][i],
+                'psi_imag': rows['imag'][i],
                 'energy': float(energies[i]),
                 'is_bound': bool(energies[i] < height)
             }
@@ -323,16 +756,16 @@ def solve_finite_well_full(grid, params):
         'probability_densities': [
             {
                 'state': i + 1,
-                'values': serialize_array(np.abs(wavefunctions[:, i])**2),
-                'max': float(np.max(np.abs(wavefunctions[:, i])**2)),
-                'penetration': float(np.sum(np.abs(wavefunctions[:, -100:, i])**2 * grid.dx))
+                'values': rows['prob'][i],
+                'max': float(rows['prob_max'][i]),
+                'penetration': float(penetration[i])
             }
             for i in range(num_states)
         ],
         'statistics': [
             {
                 'state': i + 1,
-                **calculate_statistics(grid.x, wavefunctions[:, i], grid.dx)
+                **stats[i]
             }
             for i in range(num_states)
         ],
@@ -347,14 +780,13 @@ def solve_finite_well_full(grid, params):
 
 def solve_tunneling_full(grid, params):
     """Complete tunneling visualization data"""
-    barrier_height = float(params.get('barrier_height', 30.0))
-    barrier_width = float(params.get('barrier_width', 2.0))
-    particle_energy = float(params.get('particle_energy', 20.0))
+    barrier_height = quantize(params.get('barrier_height', 30.0))
+    barrier_width = quantize(params.get('barrier_width', 2.0))
+    particle_energy = quantize(params.get('particle_energy', 20.0))
     packet_sigma = float(params.get('packet_sigma', 0.5))
     duration = int(params.get('duration', 1000))
     
-    potential = RectangularBarrier(barrier_height, barrier_width, center=0.0)
-    V = potential(grid.x)
+    V, V_served = _cached_barrier(barrier_height, barrier_width, grid.num_points)
     
     # Initial wave packet
     psi0 = GaussianWavePacket.create(
@@ -363,27 +795,63 @@ def solve_tunneling_full(grid, params):
     )
     psi0 = GaussianWavePacket.normalize(psi0, grid.dx)
     
-    # Time evolution
-    solver = TimeDependentSolver(grid, V, mass=1.0, dt=0.01)
-    trajectory = solver.evolve(psi0, duration)
+    solver = TimeDependentSolver(
+        grid, V, mass=1.0, dt=0.01, method=params.get('method', 'crank-nicolson')
+    )
+    sample_every = max(1, duration // 50)
+    frame_times = np.arange(0, duration, sample_every)
+    
+    if params.get('stream_frames'):
+        # Emit each displayed frame to the tunneling room as it is computed;
+        # the response then carries no trajectory data
+        for t, psi_final in solver.evolve_iter(psi0, duration):
+            if t % sample_every == 0:
+                socketio.emit('tunneling_frame', {
+                    'time': t,
+                    'probability': serialize_array(abs2(psi_final))
+                }, room='tunneling')
+        trajectory_payload = {
+            'frames': len(frame_times),
+            'streamed': True,
+            'room': 'tunneling'
+        }
+    else:
+        # Columnar frames: one contiguous (frames, N) float32 matrix per field,
+        # row k being the state at times[k], written in place as the ~50
+        # displayed frames are computed. Encoded natively by orjson, or as one
+        # base64 buffer per field with ?format=binary.
+        shape = (len(frame_times), grid.num_points)
+        frame_real = np.empty(shape, dtype=np.float32)
+        frame_imag = np.empty(shape, dtype=np.float32)
+        frame_prob = np.empty(shape, dtype=np.float32)
+        for k, (t, psi_final) in enumerate(solver.evolve_iter(psi0, duration, sample_every)):
+            frame_real[k] = psi_final.real
+            frame_imag[k] = psi_final.imag
+            frame_prob[k] = abs2(psi_final)
+        
+        # Advance the last kept frame to the final step
+        for _ in range(duration - 1 - frame_times[-1]):
+            psi_final = solver.step(psi_final)
+        
+        trajectory_payload = {
+            'frames': shape[0],
+            'shape': list(shape),
+            'times': frame_times.astype(np.int32),
+            'real': frame_real,
+            'imag': frame_imag,
+            'probability': frame_prob
+        }
     
-    # WKB transmission
-    analysis = PotentialAnalysis()
-    T_wkb = analysis.tunneling_probability_estimate(particle_energy, V, grid.x)
+    # WKB transmission (memoized; slider sweeps revisit the same parameters)
+    T_wkb = _cached_wkb_transmission(barrier_height, barrier_width, particle_energy, grid.num_points)
     R_wkb = 1.0 - T_wkb
     
     response = {
         'simulation_type': 'tunneling',
         'timestamp': datetime.now().isoformat(),
-        'grid': {
-            'x': serialize_array(grid.x),
-            'x_min': X_MIN,
-            'x_max': X_MAX,
-            'num_points': GRID_POINTS,
-            'dx': float(grid.dx)
-        },
+        'grid': grid_payload(grid),
         'potential': {
-            'values': serialize_array(V),
+            'values': V_served,
             'type': 'rectangular_barrier',
             'height': barrier_height,
             'width': barrier_width,
@@ -398,14 +866,14 @@ def solve_tunneling_full(grid, params):
             'psi': serialize_array(psi0),
             'psi_real': serialize_array(np.real(psi0)),
             'psi_imag': serialize_array(np.imag(psi0)),
-            'probability': serialize_array(np.abs(psi0)**2),
+            'probability': serialize_array(abs2(psi0)),
             'packet_width': float(packet_sigma)
         },
         'final_state': {
-            'psi': serialize_array(trajectory[:, -1]),
-            'psi_real': serialize_array(np.real(trajectory[:, -1])),
-            'psi_imag': serialize_array(np.imag(trajectory[:, -1])),
-            'probability': serialize_array(np.abs(trajectory[:, -1])**2)
+            'psi': serialize_array(psi_final),
+            'psi_real': serialize_array(np.real(psi_final)),
+            'psi_imag': serialize_array(np.imag(psi_final)),
+            'probability': serialize_array(abs2(psi_final))
         },
         'coefficients': {
             'transmission': float(T_wkb),
@@ -413,17 +881,7 @@ def solve_tunneling_full(grid, params):
             'transmission_percent': float(T_wkb * 100),
             'reflection_percent': float(R_wkb * 100)
         },
-        'trajectory': {
-            'frames': min(50, duration),
-            'data': [
-                {
-                    'time': int(i),
-                    'psi': serialize_array(trajectory[:, i]),
-                    'probability': serialize_array(np.abs(trajectory[:, i])**2)
-                }
-                for i in range(0, duration, max(1, duration // 50))
-            ]
-        }
+        'trajectory': trajectory_payload
     }
     
     emit_to_webhooks('on_tunneling_start', {
@@ -434,30 +892,23 @@ def solve_tunneling_full(grid, params):
 
 def solve_harmonic_full(grid, params):
     """Complete harmonic oscillator visualization data"""
-    mass = float(params.get('mass', 1.0))
-    omega = float(params.get('omega', 1.0))
+    mass = quantize(params.get('mass', 1.0))
+    omega = quantize(params.get('omega', 1.0))
     num_states = int(params.get('num_states', 5))
     
-    potential = HarmonicOscillator(mass, omega)
-    solver = StationarySolver(grid, mass=mass)
-    energies, wavefunctions = solver.solve_eigenproblem(
-        potential(grid.x), num_eigenvalues=num_states
-    )
+    V, energies, wavefunctions = _cached_harmonic(mass, omega, num_states, grid.num_points)
+    rows = state_rows(wavefunctions)
+    stats = calculate_statistics_batched(grid.x, wavefunctions, grid.dx, grid_x2(grid))
     
-    analytical_energies = np.array([(n + 0.5) * omega for n in range(num_states)])
+    analytical_energies = (np.arange(num_states) + 0.5) * omega
+    percent_errors = np.abs(energies[:num_states] - analytical_energies) / analytical_energies * 100
     
     response = {
         'simulation_type': 'harmonic-oscillator',
         'timestamp': datetime.now().isoformat(),
-        'grid': {
-            'x': serialize_array(grid.x),
-            'x_min': X_MIN,
-            'x_max': X_MAX,
-            'num_points': GRID_POINTS,
-            'dx': float(grid.dx)
-        },
+        'grid': grid_payload(grid),
         'potential': {
-            'values': serialize_array(potential(grid.x)),
+            'values': V,
             'type': 'harmonic_oscillator',
             'mass': mass,
             'omega': omega
@@ -473,9 +924,9 @@ def solve_harmonic_full(grid, params):
         'wavefunctions': [
             {
                 'state': i,
-                'psi': serialize_array(wavefunctions[:, i]),
-                'psi_real': serialize_array(np.real(wavefunctions[:, i])),
-                'psi_imag': serialize_array(np.imag(wavefunctions[:, i])),
+                'psi': rows['psi'][i],
+                'psi_real': rows['real'][i],
+                'psi_imag': rows['imag'][i],
                 'energy_numerical': float(energies[i]),
                 'energy_analytical': float(analytical_energies[i])
             }
@@ -484,15 +935,15 @@ def solve_harmonic_full(grid, params):
         'probability_densities': [
             {
                 'state': i,
-                'values': serialize_array(np.abs(wavefunctions[:, i])**2),
-                'max': float(np.max(np.abs(wavefunctions[:, i])**2))
+                'values': rows['prob'][i],
+                'max': float(rows['prob_max'][i])
             }
             for i in range(num_states)
         ],
         'statistics': [
             {
                 'state': i,
-                **calculate_statistics(grid.x, wavefunctions[:, i], grid.dx)
+                **stats[i]
             }
             for i in range(num_states)
         ],
@@ -501,7 +952,7 @@ def solve_harmonic_full(grid, params):
                 'state': i,
                 'numerical_energy': float(energies[i]),
                 'analytical_energy': float(analytical_energies[i]),
-                'percent_error': float(abs(energies[i] - analytical_energies[i]) / analytical_energies[i] * 100)
+                'percent_error': float(percent_errors[i])
             }
             for i in range(num_states)
         ]
@@ -510,6 +961,15 @@ def solve_harmonic_full(grid, params):
     return response
 
 
+# Simulation type -> response builder, shared by the sync and async paths
+SOLVERS = {
+    'infinite-well': solve_infinite_well_full,
+    'finite-well': solve_finite_well_full,
+    'tunneling': solve_tunneling_full,
+    'harmonic': solve_harmonic_full
+}
+
+
 # ============================================================================
 # WEBHOOK MANAGEMENT
 # ============================================================================
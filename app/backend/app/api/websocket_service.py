@@ -5,13 +5,61 @@ Handles client connections, subscriptions, and live parameter updates
 
 from flask_socketio import emit, join_room, leave_room
 import numpy as np
+import orjson
 from datetime import datetime
 from threading import Thread
 import time
+import zlib
+
+try:
+    import blosc2
+except ImportError:  # optional; fall back to zlib for compressed frames
+    blosc2 = None
+
+# Streaming configuration
+GRID_POINTS = 1000
+X_MIN = -15
+X_MAX = 15
+STREAM_INTERVAL = 0.05  # seconds between emits
+FRAMES_PER_EMIT = 5     # time steps batched into one emit
+BROADCAST_BATCH_SIZE = 32  # subscribers per emit before yielding
+COMPRESSION_CODEC = 'blosc2-lz4' if blosc2 is not None else 'zlib'
+
+
+def float32_list(arr):
+    """
+    Array as a list of floats rounded to float32 precision.
+
+    Round-tripping through orjson gives the shortest float32 repr ("0.3"
+    rather than "0.30000001192092896"), so the list is half the JSON size of
+    the float64 one with any serializer, and the loop runs in native code.
+    """
+    arr32 = np.ascontiguousarray(arr, dtype=np.float32)
+    return orjson.loads(orjson.dumps(arr32, option=orjson.OPT_SERIALIZE_NUMPY))
+
+
+def compress_frame(arr):
+    """
+    Pack an array as compressed float32 bytes.
+
+    Wavefunctions and densities are smooth, so they compress well; the
+    result is encoded once and reused for every subscriber.
+    """
+    raw = np.ascontiguousarray(arr, dtype=np.float32).tobytes()
+    if blosc2 is not None:
+        return blosc2.compress2(raw, codec=blosc2.Codec.LZ4, clevel=5, typesize=4)
+    return zlib.compress(raw, 1)
 
 
 class WebSocketService:
-    """Manages WebSocket connections and real-time data streaming"""
+    """
+    Manages WebSocket connections and real-time data streaming
+
+    Streamed frames are emitted as raw float32 bytes, which Socket.IO sends
+    as binary attachments alongside a small JSON header. Probability and
+    wavefunction broadcasts can also be sent compressed (``compress=True``);
+    the header's ``codec`` names the compressor (blosc2 LZ4, or zlib).
+    """
     
     def __init__(self, socketio):
         self.socketio = socketio
@@ -83,42 +131,146 @@ class WebSocketService:
             
             if not self.active_rooms[room]:
                 del self.active_rooms[room]
+                self.stop_stream(room)
     
     def stream_simulation(self, room, simulation_type, parameters):
         """Stream simulation updates to subscribed clients"""
-        # This would be connected to real-time parameter updates
-        pass
+        if simulation_type != 'tunneling':
+            return
+        
+        # Restart the room's stream with the new parameters
+        self.stop_stream(room)
+        stream = {'active': True, 'started_at': datetime.now().isoformat()}
+        self.simulation_streams[room] = stream
+        
+        # Background task runs as a greenlet under eventlet/gevent, so the
+        # stream yields cooperatively instead of holding a thread per client
+        self.socketio.start_background_task(
+            self._stream_tunneling, room, parameters, stream
+        )
+    
+    def stop_stream(self, room):
+        """Stop the active stream for a room, if any"""
+        stream = self.simulation_streams.pop(room, None)
+        if stream:
+            stream['active'] = False
+    
+    def _stream_tunneling(self, room, parameters, stream):
+        """Evolve a wave packet and emit batches of frames to a room"""
+        # Imported here: quantum_playground is only importable once the API
+        # module has put src/ on sys.path, and this module must load without it
+        from quantum_playground.solvers import (
+            QuantumGrid, TimeDependentSolver, GaussianWavePacket, abs2
+        )
+        from quantum_playground.potentials import RectangularBarrier
+        
+        barrier_height = float(parameters.get('barrier_height', 30.0))
+        barrier_width = float(parameters.get('barrier_width', 2.0))
+        particle_energy = float(parameters.get('particle_energy', 20.0))
+        packet_sigma = float(parameters.get('packet_sigma', 0.5))
+        duration = int(parameters.get('duration', 1000))
+        
+        grid = QuantumGrid(X_MIN, X_MAX, GRID_POINTS)
+        V = RectangularBarrier(barrier_height, barrier_width, center=0.0)(grid.x)
+        solver = TimeDependentSolver(grid, V, mass=1.0, dt=0.01)
+        
+        psi = GaussianWavePacket.create(
+            grid.x, x0=-5.0, sigma=packet_sigma,
+            k0=np.sqrt(2.0 * particle_energy), amplitude=1.0
+        )
+        psi = GaussianWavePacket.normalize(psi, grid.dx)
+        
+        # Frames are written into a reused float32 buffer and shipped as a
+        # raw binary attachment (Float32Array on the client, no JSON parsing)
+        frame_buf = np.empty((FRAMES_PER_EMIT, GRID_POINTS), dtype=np.float32)
+        count = 0
+        for step in range(1, duration + 1):
+            if not stream['active']:
+                return
+            psi = solver.step(psi)
+            frame_buf[count] = abs2(psi)
+            count += 1
+            
+            if count == FRAMES_PER_EMIT or step == duration:
+                self.socketio.emit('tunneling_frames', {
+                    'first_step': step - count + 1,
+                    'shape': [count, GRID_POINTS],
+                    'dtype': 'float32',
+                    'data': frame_buf[:count].tobytes(),
+                    'timestamp': datetime.now().isoformat()
+                }, room=room)
+                count = 0
+                self.socketio.sleep(STREAM_INTERVAL)
+        
+        if self.simulation_streams.get(room) is stream:
+            del self.simulation_streams[room]
+        self.socketio.emit('stream_complete', {'room': room, 'steps': duration}, room=room)
+    
+    def _emit_batched(self, event, payload, room):
+        """
+        Emit one payload to a room's subscribers in batches, yielding between
+        batches so a large room does not hold the event loop for one send.
+        
+        Each batch is a single emit to a list of client sids, so the payload
+        is encoded once per batch rather than once per subscriber.
+        """
+        subscribers = list(self.active_rooms.get(room, ()))
+        if len(subscribers) <= BROADCAST_BATCH_SIZE:
+            self.socketio.emit(event, payload, room=room)
+            return
+        for start in range(0, len(subscribers), BROADCAST_BATCH_SIZE):
+            self.socketio.emit(event, payload, to=subscribers[start:start + BROADCAST_BATCH_SIZE])
+            self.socketio.sleep(0)
     
     def broadcast_energy_levels(self, room, energies):
         """Broadcast energy level updates"""
-        self.socketio.emit('energy_update', {
+        self._emit_batched('energy_update', {
             'energies': energies.tolist() if isinstance(energies, np.ndarray) else energies,
             'timestamp': datetime.now().isoformat()
-        }, room=room)
+        }, room)
+    
+    def _emit_compressed(self, event, room, state_id, arr):
+        """Compress an array once and emit it as a binary attachment"""
+        self._emit_batched(event, {
+            'state_id': state_id,
+            'shape': list(arr.shape),
+            'dtype': 'float32',
+            'codec': COMPRESSION_CODEC,
+            'data': compress_frame(arr),
+            'timestamp': datetime.now().isoformat()
+        }, room)
     
-    def broadcast_probability(self, room, probability, state_id):
+    def broadcast_probability(self, room, probability, state_id, compress=False):
         """Broadcast probability density updates"""
-        self.socketio.emit('probability_update', {
+        if compress:
+            self._emit_compressed('probability_update_bin', room, state_id, np.asarray(probability))
+            return
+        self._emit_batched('probability_update', {
             'state_id': state_id,
-            'values': probability.tolist() if isinstance(probability, np.ndarray) else probability,
+            'values': float32_list(probability) if isinstance(probability, np.ndarray) else probability,
             'timestamp': datetime.now().isoformat()
-        }, room=room)
+        }, room)
     
-    def broadcast_wavefunction(self, room, psi, state_id):
+    def broadcast_wavefunction(self, room, psi, state_id, compress=False):
         """Broadcast wavefunction updates"""
-        self.socketio.emit('wavefunction_update', {
+        if compress:
+            # Rows are [real, imag]
+            self._emit_compressed('wavefunction_update_bin', room, state_id,
+                                  np.stack((np.real(psi), np.imag(psi))))
+            return
+        self._emit_batched('wavefunction_update', {
             'state_id': state_id,
-            'real': np.real(psi).tolist(),
-            'imag': np.imag(psi).tolist(),
+            'real': float32_list(np.real(psi)),
+            'imag': float32_list(np.imag(psi)),
             'timestamp': datetime.now().isoformat()
-        }, room=room)
+        }, room)
     
     def broadcast_statistics(self, room, stats):
         """Broadcast quantum statistics"""
-        self.socketio.emit('statistics_update', {
+        self._emit_batched('statistics_update', {
             'stats': stats,
             'timestamp': datetime.now().isoformat()
-        }, room=room)
+        }, room)
     
     def get_active_subscriptions(self):
         """Get info about active subscriptions"""
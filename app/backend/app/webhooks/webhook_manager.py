@@ -3,15 +3,29 @@ Webhook system for external service integration
 Allows third-party services to subscribe to simulation events
 """
 
+import numpy as np
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
-from typing import Dict, List, Callable
+from typing import Dict, List, Set, Callable
 from enum import Enum
 import json
+import random
 import threading
-from queue import Queue
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 import logging
 
+try:
+    import h2  # noqa: F401  (httpx needs it for http2=True)
+    import httpx
+except ImportError:  # optional: HTTP/2 multiplexing per host
+    httpx = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -26,21 +40,144 @@ class WebhookEvent(Enum):
     CONVERGENCE_REACHED = "convergence.reached"
 
 
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_TIMEOUT_ERRORS = (requests.exceptions.Timeout,)
+_CONNECTION_ERRORS = (requests.exceptions.ConnectionError,)
+if httpx is not None:
+    _TIMEOUT_ERRORS += (httpx.TimeoutException,)
+    _CONNECTION_ERRORS += (httpx.TransportError,)
+
+
+def full_jitter(base: float, attempt: int, cap: float = 30.0) -> float:
+    """Full-jitter exponential backoff: uniform(0, min(cap, base * 2**attempt))"""
+    if attempt < 0 or base <= 0:
+        return 0.0
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+# Never dropped for lack of queue space unless the queue stays full for
+# HIGH_PRIORITY_WAIT seconds; every other event is dropped as soon as it is
+HIGH_PRIORITY_EVENTS = frozenset({
+    WebhookEvent.SIMULATION_COMPLETE,
+    WebhookEvent.ERROR_OCCURRED,
+    WebhookEvent.CONVERGENCE_REACHED,
+})
+HIGH_PRIORITY_WAIT = 0.5
+
+
+class JitteredRetry(Retry):
+    """
+    urllib3 Retry with full-jitter exponential backoff
+    
+    Sleeps uniform(0, min(cap, base * 2**attempt)) before every retry, so
+    subscribers that failed together do not retry in lockstep. A Retry-After
+    header, when present, takes precedence (urllib3 honours it).
+    """
+    
+    backoff_cap = 30.0
+    
+    def get_backoff_time(self) -> float:
+        return full_jitter(self.backoff_factor, len(self.history) - 1, self.backoff_cap)
+
+
 class WebhookRegistry:
     """Manages webhook registrations and event dispatch"""
     
-    def __init__(self):
-        self.webhooks: Dict[WebhookEvent, List[str]] = {
-            event: [] for event in WebhookEvent
+    def __init__(self, max_workers: int = 16, max_batch: int = 256,
+                 failure_threshold: int = 5, recovery_timeout: float = 60.0,
+                 max_per_host: int = 4, http2: bool = True,
+                 max_queue: int = 10_000):
+        self.webhooks: Dict[WebhookEvent, Set[str]] = {
+            event: set() for event in WebhookEvent
         }
         self.webhook_metadata: Dict[str, Dict] = {}
-        self.event_queue = Queue()
+        # Running totals for get_status(), kept in step with webhooks and
+        # webhook_metadata so a status poll does not rescan the registry
+        self._total_count = 0
+        self._active_count = 0
+        self._meta_lock = threading.Lock()
+        # Successful deliveries only buffer their bookkeeping here; it is
+        # merged into webhook_metadata when a URL's status code changes,
+        # every metadata_flush_every deliveries, or when status is read
+        self._metadata_dirty: Dict[str, Dict] = {}
+        self._dirty_writes = 0
+        self.metadata_flush_every = 100
+        # Plain deque guarded by one condition: trigger() appends and
+        # notifies, the event thread drains a whole batch per wake-up.
+        # Bounded at max_queue so a slow subscriber cannot grow it without
+        # limit; see trigger() for what happens when it is full
+        self.event_queue = deque()
+        self._cv = threading.Condition()
+        self.max_queue = max_queue
+        self.dropped_count = 0
+        self._last_drop_warning = 0.0
+        self.max_retries = 3
+        self.timeout = 5
+        self.backoff_base = 0.5
+        self.max_batch = max_batch
+        # Per-URL circuit breakers: after failure_threshold consecutive
+        # failures a URL is skipped (OPEN) for recovery_timeout seconds, then
+        # a single trial dispatch (HALF_OPEN) decides whether it closes again
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._breakers: Dict[str, Dict] = {}
+        self._breaker_lock = threading.Lock()
+        # One pooled session for every dispatch: connections (and TLS
+        # sessions) are reused per host, and urllib3 handles retries
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            # Only timeouts, connection errors and 429/5xx are retried;
+            # other 4xx responses are returned immediately
+            max_retries=JitteredRetry(
+                total=self.max_retries,
+                backoff_factor=self.backoff_base,
+                status_forcelist=list(RETRY_STATUSES),
+                allowed_methods=None,  # webhooks are POSTs; retry them too
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+        )
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        # With httpx[http2] installed, concurrent POSTs to one host share a
+        # single multiplexed connection instead of one socket each
+        self._http2 = None
+        if http2 and httpx is not None:
+            # Pool limits belong on the transport: a client given transport=
+            # ignores its own http2/limits arguments
+            self._http2 = httpx.Client(
+                timeout=self.timeout,
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    retries=self.max_retries,
+                    limits=httpx.Limits(max_keepalive_connections=32, max_connections=128)
+                )
+            )
+        # Dispatches run on a worker pool without waiting on each other, so
+        # a batch costs the slowest endpoint's round trip rather than the sum.
+        # Bulkheads: at most max_per_host calls in flight to any one host, and
+        # at most 4 * max_workers dispatches outstanding (running or waiting
+        # for their host) before the event thread stops draining the queue
+        # (backpressure instead of an unbounded backlog). A delivery whose
+        # host is at its limit waits in that host's pending deque rather than
+        # on a pool thread, so a slow host cannot tie up the whole pool.
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='webhook'
+        )
+        self.max_per_host = max_per_host
+        self._host_sems: Dict[str, threading.Semaphore] = defaultdict(
+            lambda: threading.Semaphore(self.max_per_host)
+        )
+        self._host_pending: Dict[str, deque] = defaultdict(deque)
+        self._host_lock = threading.Lock()
+        self._inflight = threading.BoundedSemaphore(4 * max_workers)
         self.event_thread = threading.Thread(
             target=self._process_events, daemon=True
         )
         self.event_thread.start()
-        self.max_retries = 3
-        self.timeout = 5
     
     def register(self, event: WebhookEvent, webhook_url: str,
                  metadata: Dict = None) -> bool:
@@ -55,30 +192,44 @@ class WebhookRegistry:
         Returns:
             True if registered, False if already registered
         """
-        if webhook_url not in self.webhooks[event]:
-            self.webhooks[event].append(webhook_url)
-            self.webhook_metadata[webhook_url] = {
-                'url': webhook_url,
-                'event': event.value,
-                'registered_at': datetime.now().isoformat(),
-                'active': True,
-                'retry_count': 0,
-                'last_triggered': None,
-                **(metadata or {})
-            }
-            logger.info(f"Webhook registered: {webhook_url} for {event.value}")
-            return True
-        return False
+        entry = {
+            'url': webhook_url,
+            'event': event.value,
+            'registered_at': datetime.now().isoformat(),
+            'active': True,
+            'retry_count': 0,
+            'last_triggered': None,
+            **(metadata or {})
+        }
+        # Membership test and counter updates under one lock, so concurrent
+        # registrations of the same URL cannot both count it
+        with self._meta_lock:
+            if webhook_url in self.webhooks[event]:
+                return False
+            self.webhooks[event].add(webhook_url)
+            self._total_count += 1
+            # A URL already subscribed to another event has its entry replaced
+            previous = self.webhook_metadata.get(webhook_url)
+            if previous is not None and previous.get('active', True):
+                self._active_count -= 1
+            if entry.get('active', True):
+                self._active_count += 1
+            self.webhook_metadata[webhook_url] = entry
+        logger.info("Webhook registered: %s for %s", webhook_url, event.value)
+        return True
     
     def unregister(self, event: WebhookEvent, webhook_url: str) -> bool:
         """Unregister a webhook"""
-        if webhook_url in self.webhooks[event]:
+        with self._meta_lock:
+            if webhook_url not in self.webhooks[event]:
+                return False
             self.webhooks[event].remove(webhook_url)
-            if webhook_url in self.webhook_metadata:
-                del self.webhook_metadata[webhook_url]
-            logger.info(f"Webhook unregistered: {webhook_url}")
-            return True
-        return False
+            self._total_count -= 1
+            previous = self.webhook_metadata.pop(webhook_url, None)
+            if previous is not None and previous.get('active', True):
+                self._active_count -= 1
+        logger.info("Webhook unregistered: %s", webhook_url)
+        return True
     
     def unregister_all(self, webhook_url: str) -> int:
         """Unregister webhook from all events"""
@@ -93,12 +244,12 @@ class WebhookRegistry:
         if event:
             return {
                 'event': event.value,
-                'webhooks': self.webhooks[event],
+                'webhooks': sorted(self.webhooks[event]),
                 'count': len(self.webhooks[event])
             }
         
         return {
-            event.value: self.webhooks[event]
+            event.value: sorted(self.webhooks[event])
             for event in WebhookEvent
         }
     
@@ -110,93 +261,338 @@ class WebhookRegistry:
             event: Event type
             payload: Event data to send
         """
-        self.event_queue.put({
-            'event': event,
-            'payload': payload,
-            'timestamp': datetime.now().isoformat()
-        })
+        # Nothing subscribed: skip the clock read, allocation and queue lock
+        # (per-step events are usually unsubscribed)
+        if not self.webhooks[event]:
+            return
+        with self._cv:
+            if len(self.event_queue) >= self.max_queue and not (
+                event in HIGH_PRIORITY_EVENTS
+                and self._cv.wait_for(
+                    lambda: len(self.event_queue) < self.max_queue,
+                    timeout=HIGH_PRIORITY_WAIT
+                )
+            ):
+                self._drop(event)
+                return
+            self.event_queue.append({
+                'event': event,
+                'payload': payload,
+                'timestamp': datetime.now().isoformat()
+            })
+            self._cv.notify()
+    
+    def _drop(self, event: WebhookEvent) -> None:
+        """Count an event dropped on a full queue; caller holds _cv"""
+        self.dropped_count += 1
+        now = time.monotonic()
+        if now - self._last_drop_warning >= 1.0:
+            self._last_drop_warning = now
+            logger.warning("Webhook queue full (%d), dropping %s (%d dropped so far)",
+                           self.max_queue, event.value, self.dropped_count)
     
     def _process_events(self) -> None:
-        """Process queued events and dispatch to webhooks"""
+        """
+        Process queued events and dispatch to webhooks
+        
+        Whatever has queued up (up to max_batch events) is drained at once and
+        grouped by destination, so each subscriber gets one POST per batch
+        rather than one per event.
+        """
         while True:
             try:
-                event_data = self.event_queue.get(timeout=1)
-                event = event_data['event']
-                payload = event_data['payload']
+                with self._cv:
+                    if not self._cv.wait_for(lambda: self.event_queue, timeout=1):
+                        continue
+                    popleft = self.event_queue.popleft
+                    batch = [popleft() for _ in range(min(len(self.event_queue), self.max_batch))]
+                    # Wake any high-priority trigger() waiting for room
+                    self._cv.notify_all()
                 
-                for webhook_url in self.webhooks[event]:
-                    self._dispatch_webhook(webhook_url, event, payload)
+                per_url: Dict[str, List[Dict]] = defaultdict(list)
+                for event_data in batch:
+                    for webhook_url in list(self.webhooks[event_data['event']]):
+                        per_url[webhook_url].append(event_data)
+                
+                # Subscribers that receive the same events share one encoded
+                # body, so a payload is serialized once, not once per URL
+                now_iso = datetime.now().isoformat()
+                deliveries: Dict[tuple, Dict] = {}
+                for webhook_url, events in per_url.items():
+                    key = tuple(id(event_data) for event_data in events)
+                    if key not in deliveries:
+                        deliveries[key] = self._encode_or_skip(webhook_url, events, now_iso)
+                    delivery = deliveries[key]
+                    if delivery is None:
+                        continue
+                    
+                    self._inflight.acquire()
+                    self._submit_for_host(
+                        urlparse(webhook_url).netloc, webhook_url, delivery
+                    )
             
-            except Exception as e:
-                logger.debug(f"Event processing: {e}")
+            except Exception:
+                logger.exception("Webhook event processing failed")
     
-    def _dispatch_webhook(self, webhook_url: str, event: WebhookEvent,
-                          payload: Dict) -> None:
-        """Dispatch event to webhook with retries"""
-        headers = {
-            'Content-Type': 'application/json',
-            'X-Webhook-Event': event.value,
-            'X-Webhook-Timestamp': datetime.now().isoformat()
-        }
+    def _submit_for_host(self, host: str, webhook_url: str, delivery: Dict) -> None:
+        """Run a dispatch now if its host has a free slot, else park it"""
+        with self._host_lock:
+            if not self._host_sems[host].acquire(blocking=False):
+                self._host_pending[host].append((webhook_url, delivery))
+                return
+        self._executor.submit(self._dispatch_with_sem, host, webhook_url, delivery)
+    
+    def _dispatch_with_sem(self, host: str, webhook_url: str, delivery: Dict) -> None:
+        """
+        Dispatch holding one of the host's slots
         
-        full_payload = {
-            'event': event.value,
-            'timestamp': datetime.now().isoformat(),
-            'data': payload
+        On completion the slot passes to the host's next pending delivery,
+        which goes to the back of the pool's queue so other hosts get their
+        turn, or is released when none is waiting.
+        """
+        try:
+            self._dispatch_webhook(webhook_url, delivery)
+        finally:
+            self._inflight.release()
+            with self._host_lock:
+                pending = self._host_pending[host]
+                if not pending:
+                    self._host_sems[host].release()
+                    return
+                next_url, next_delivery = pending.popleft()
+            self._executor.submit(self._dispatch_with_sem, host, next_url, next_delivery)
+    
+    def _breaker_allows(self, webhook_url: str) -> bool:
+        """Whether the URL's circuit breaker lets a dispatch through"""
+        with self._breaker_lock:
+            breaker = self._breakers.get(webhook_url)
+            if breaker is None or breaker['state'] == 'CLOSED':
+                return True
+            if breaker['state'] == 'OPEN':
+                if time.time() - breaker['opened_at'] < self.recovery_timeout:
+                    return False
+                breaker['state'] = 'HALF_OPEN'
+                return True
+            # HALF_OPEN: a trial dispatch is already in flight
+            return False
+    
+    def _record_result(self, webhook_url: str, ok: bool) -> None:
+        """Update the URL's circuit breaker after a dispatch"""
+        with self._breaker_lock:
+            breaker = self._breakers.setdefault(
+                webhook_url, {'state': 'CLOSED', 'failures': 0, 'opened_at': None}
+            )
+            if ok:
+                breaker.update(state='CLOSED', failures=0, opened_at=None)
+                return
+            breaker['failures'] += 1
+            if (breaker['state'] == 'HALF_OPEN'
+                    or breaker['failures'] >= self.failure_threshold):
+                breaker.update(state='OPEN', opened_at=time.time())
+                logger.warning("Circuit open for %ss: %s", self.recovery_timeout, webhook_url)
+    
+    @staticmethod
+    def _encode_delivery(events: List[Dict], now_iso: str) -> Dict:
+        """
+        Encode queued events for one POST: JSON body bytes plus headers
+        
+        A single event is sent as {event, timestamp, data}. Several are sent
+        together as {event: "batch", timestamp, batch: [...]}, each element
+        keeping its own event name and trigger timestamp.
+        """
+        if len(events) == 1:
+            event_name = events[0]['event'].value
+            full_payload = {
+                'event': event_name,
+                'timestamp': now_iso,
+                'data': events[0]['payload']
+            }
+        else:
+            event_name = 'batch'
+            full_payload = {
+                'event': 'batch',
+                'timestamp': now_iso,
+                'batch': [
+                    {
+                        'event': event_data['event'].value,
+                        'timestamp': event_data['timestamp'],
+                        'data': event_data['payload']
+                    }
+                    for event_data in events
+                ]
+            }
+        
+        return {
+            'body': orjson.dumps(
+                full_payload,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ),
+            'headers': {
+                'Content-Type': 'application/json',
+                'X-Webhook-Event': event_name,
+                'X-Webhook-Timestamp': now_iso,
+                'X-Webhook-Batch-Size': str(len(events))
+            },
+            'timestamp': now_iso,
+            'count': len(events)
         }
+    
+    def _encode_or_skip(self, webhook_url: str, events: List[Dict], now_iso: str):
+        """
+        Encode a delivery, leaving out events whose payload cannot be serialized
         
-        for attempt in range(self.max_retries):
+        Only the unencodable events are dropped (and logged); the rest still go
+        out. Returns None when nothing is left to send.
+        """
+        try:
+            return self._encode_delivery(events, now_iso)
+        except orjson.JSONEncodeError:
+            pass
+        
+        encodable = []
+        for event_data in events:
             try:
-                response = requests.post(
-                    webhook_url,
-                    json=full_payload,
-                    headers=headers,
-                    timeout=self.timeout
-                )
-                
-                # Update metadata
-                if webhook_url in self.webhook_metadata:
-                    self.webhook_metadata[webhook_url]['last_triggered'] = \
-                        datetime.now().isoformat()
-                    self.webhook_metadata[webhook_url]['last_status'] = \
-                        response.status_code
-                    self.webhook_metadata[webhook_url]['retry_count'] = 0
-                
-                logger.info(
-                    f"Webhook delivered: {webhook_url} -> {response.status_code}"
-                )
-                return
+                self._encode_delivery([event_data], now_iso)
+            except orjson.JSONEncodeError as e:
+                logger.error("Webhook payload not serializable, dropping %s for %s: %s",
+                             event_data['event'].value, webhook_url, e)
+            else:
+                encodable.append(event_data)
+        return self._encode_delivery(encodable, now_iso) if encodable else None
+    
+    def _post(self, webhook_url: str, delivery: Dict):
+        """
+        POST one delivery, retrying 429/5xx with jittered backoff
+        
+        The requests session retries inside urllib3. httpx only retries
+        failed connects, so status retries are replayed here to match.
+        """
+        if self._http2 is None:
+            return self._session.post(
+                webhook_url,
+                data=delivery['body'],
+                headers=delivery['headers'],
+                timeout=self.timeout
+            )
+        
+        for attempt in range(self.max_retries + 1):
+            response = self._http2.post(
+                webhook_url, content=delivery['body'], headers=delivery['headers']
+            )
+            if response.status_code not in RETRY_STATUSES or attempt == self.max_retries:
+                return response
+            # Capped like the session's backoff: a huge Retry-After would hold
+            # a pool thread, a host slot and an in-flight permit all that time
+            retry_after = response.headers.get('Retry-After', '')
+            time.sleep(
+                min(float(retry_after), JitteredRetry.backoff_cap) if retry_after.isdigit()
+                else full_jitter(self.backoff_base, attempt, JitteredRetry.backoff_cap)
+            )
+    
+    def _dispatch_webhook(self, webhook_url: str, delivery: Dict) -> None:
+        """
+        POST an encoded delivery to one webhook; retries are handled by the session
+        
+        Skipped while the URL's circuit breaker is open.
+        """
+        if not self._breaker_allows(webhook_url):
+            logger.debug("Circuit open, skipping %d event(s): %s", delivery['count'], webhook_url)
+            return
+        
+        try:
+            response = self._post(webhook_url, delivery)
+            # 429/5xx that survived the retries count against the breaker
+            self._record_result(
+                webhook_url,
+                response.status_code < 500 and response.status_code != 429
+            )
             
-            except requests.exceptions.Timeout:
-                logger.warning(
-                    f"Webhook timeout (attempt {attempt+1}/{self.max_retries}): "
-                    f"{webhook_url}"
-                )
-            except requests.exceptions.ConnectionError:
+            # Update metadata (buffered; see _flush_metadata)
+            with self._meta_lock:
+                meta = self.webhook_metadata.get(webhook_url)
+                if meta is not None:
+                    self._metadata_dirty[webhook_url] = {
+                        'last_triggered': delivery['timestamp'],
+                        'last_status': response.status_code,
+                        'retry_count': 0
+                    }
+                    self._dirty_writes += 1
+                    if (meta.get('last_status') != response.status_code
+                            or self._dirty_writes >= self.metadata_flush_every):
+                        self._flush_metadata_locked()
+            
+            logger.info("Webhook delivered: %s -> %s", webhook_url, response.status_code)
+            return
+        
+        except _TIMEOUT_ERRORS as e:
+            # urllib3 retries every timeout; the httpx transport only retries
+            # failed connects, so its read/write timeouts were not retried
+            if (httpx is not None and isinstance(e, httpx.TimeoutException)
+                    and not isinstance(e, httpx.ConnectTimeout)):
+                logger.warning("Webhook timeout (not retried): %s", webhook_url)
+            else:
                 logger.warning(
-                    f"Webhook connection error (attempt {attempt+1}/"
-                    f"{self.max_retries}): {webhook_url}"
+                    "Webhook timeout after %d retries: %s", self.max_retries, webhook_url
                 )
-            except Exception as e:
-                logger.error(f"Webhook error: {webhook_url} -> {e}")
+        except _CONNECTION_ERRORS:
+            logger.warning(
+                "Webhook connection error after %d retries: %s",
+                self.max_retries, webhook_url
+            )
+        except Exception as e:
+            logger.error("Webhook error: %s -> %s", webhook_url, e)
+        
+        self._record_result(webhook_url, False)
         
         # Mark as failed after retries
-        if webhook_url in self.webhook_metadata:
-            self.webhook_metadata[webhook_url]['retry_count'] += 1
-            if self.webhook_metadata[webhook_url]['retry_count'] >= self.max_retries:
-                self.webhook_metadata[webhook_url]['active'] = False
-                logger.error(f"Webhook deactivated after {self.max_retries} retries: "
-                            f"{webhook_url}")
+        with self._meta_lock:
+            meta = self.webhook_metadata.get(webhook_url)
+            if meta is None:
+                return
+            # Apply any buffered success first so retry_count starts from it
+            meta.update(self._metadata_dirty.pop(webhook_url, ()))
+            meta['retry_count'] += 1
+            if meta['retry_count'] < self.max_retries or not meta.get('active', True):
+                return
+            meta['active'] = False
+            self._active_count -= 1
+        logger.error("Webhook deactivated after %d retries: %s",
+                     self.max_retries, webhook_url)
+    
+    def _flush_metadata_locked(self) -> None:
+        """Merge buffered delivery bookkeeping; caller holds _meta_lock"""
+        for webhook_url, update in self._metadata_dirty.items():
+            meta = self.webhook_metadata.get(webhook_url)
+            if meta is not None:
+                meta.update(update)
+        self._metadata_dirty.clear()
+        self._dirty_writes = 0
+    
+    def _flush_metadata(self) -> None:
+        """Merge buffered delivery bookkeeping into webhook_metadata"""
+        with self._meta_lock:
+            self._flush_metadata_locked()
     
     def get_status(self) -> Dict:
         """Get webhook system status"""
+        self._flush_metadata()
+        if logger.isEnabledFor(logging.DEBUG):
+            # Cross-check the running counters against a full rescan
+            with self._meta_lock:
+                assert self._total_count == sum(len(urls) for urls in self.webhooks.values())
+                assert self._active_count == sum(
+                    1 for m in self.webhook_metadata.values() if m.get('active', True)
+                )
         return {
-            'total_webhooks': sum(len(urls) for urls in self.webhooks.values()),
-            'active_webhooks': len([m for m in self.webhook_metadata.values()
-                                   if m.get('active', True)]),
+            'total_webhooks': self._total_count,
+            'active_webhooks': self._active_count,
             'events': self.get_webhooks(),
             'metadata': self.webhook_metadata,
-            'queue_size': self.event_queue.qsize()
+            'circuit_breakers': {
+                url: breaker['state'] for url, breaker in self._breakers.items()
+            },
+            'queue_size': len(self.event_queue),
+            'dropped_count': self.dropped_count
         }
 
 
@@ -214,14 +610,29 @@ class WebhookEventBuilder:
             'completion_time': datetime.now().isoformat()
         }
     
+    # Above this many levels, auto-generated labels are sent as
+    # labels_prefix/labels_count (label i is f"{prefix}{i}") instead of a list
+    MAX_EXPANDED_LABELS = 1000
+    
     @staticmethod
     def energy_calculated(energies: List[float], labels: List[str] = None) -> Dict:
-        """Build energy calculation event payload"""
+        """
+        Build energy calculation event payload
+        
+        energies may be a list or a NumPy array (the ground state is then
+        found without a Python-level loop). Explicit labels are kept as given.
+        """
+        arr = np.asarray(energies)
+        n = int(arr.size)
+        if labels is not None or n <= WebhookEventBuilder.MAX_EXPANDED_LABELS:
+            label_fields = {'labels': labels or [f"E_{i}" for i in range(n)]}
+        else:
+            label_fields = {'labels_prefix': 'E_', 'labels_count': n}
         return {
             'energies': energies,
-            'labels': labels or [f"E_{i}" for i in range(len(energies))],
-            'count': len(energies),
-            'ground_state': min(energies) if energies else None
+            **label_fields,
+            'count': n,
+            'ground_state': float(arr.min()) if n else None
         }
     
     @staticmethod
@@ -0,0 +1,27 @@
+"""
+Gunicorn configuration for the Quantum Simulator backend
+
+Usage (from app/backend):
+    gunicorn -c gunicorn_conf.py app.api.enhanced_api:app
+
+A single gthread worker keeps connected clients, webhook registrations and the
+solver caches in one process, and serves requests from a pool of threads, so a
+slow simulation no longer holds up every other request the way it does on the
+single-threaded development server. SOCKETIO_ASYNC_MODE=threading makes
+Flask-SocketIO use the same threading model as the worker. How much of a
+solve overlaps with other requests depends on the GIL: the Crank-Nicolson step
+(LAPACK zgttrf/zgttrs) is driven by a Python loop, so time evolutions largely
+take turns.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers = 1
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', os.cpu_count() or 4))
+timeout = 120
+
+# Flask-SocketIO would otherwise pick gevent when it is installed, which does
+# not match the threaded worker
+raw_env = ['SOCKETIO_ASYNC_MODE=threading']
@@ -9,6 +9,7 @@ import json
 import time
 from datetime import datetime
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 print("="*70)
@@ -19,7 +20,17 @@ print("="*70)
 packages_ok = True
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     print("✅ requests module available")
+    # One pooled session for every test; transient 502-504s are retried
+    session = requests.Session()
+    adapter = HTTPAdapter(max_retries=Retry(
+        total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504],
+        allowed_methods=None, raise_on_status=False
+    ))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
 except ImportError:
     print("⚠️  requests module not found (for testing)")
     packages_ok = False
@@ -35,7 +46,7 @@ print("\n[TEST 1] Health Check")
 print("-" * 70)
 try:
     if packages_ok:
-        response = requests.get(f"{API_BASE}/health", timeout=5)
+        response = session.get(f"{API_BASE}/health", timeout=5)
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Server is running")
@@ -50,21 +61,78 @@ except Exception as e:
     print(f"❌ Health check error: {e}")
     print(f"   Make sure backend is running: python app/api/enhanced_api.py")
 
+# Tests 2-5 are independent simulation requests: send them concurrently up
+# front (requests releases the GIL while waiting), then report each in order
+SIMULATION_PAYLOADS = {
+    "infinite-well": {
+        "type": "infinite-well",
+        "parameters": {
+            "width": 5.0,
+            "num_states": 3
+        }
+    },
+    "harmonic": {
+        "type": "harmonic",
+        "parameters": {
+            "mass": 1.0,
+            "omega": 1.0,
+            "num_states": 3
+        }
+    },
+    "finite-well": {
+        "type": "finite-well",
+        "parameters": {
+            "width": 5.0,
+            "height": 50.0,
+            "num_states": 3
+        }
+    },
+    "tunneling": {
+        "type": "tunneling",
+        "parameters": {
+            "barrier_height": 30.0,
+            "barrier_width": 2.0,
+            "particle_energy": 20.0,
+            "packet_sigma": 0.5,
+            "duration": 100
+        }
+    }
+}
+
+
+def post_simulation(payload):
+    """POST one simulation; errors are returned so they surface in its test"""
+    try:
+        return session.post(f"{API_BASE}/full-simulation", json=payload, timeout=10)
+    except Exception as e:
+        return e
+
+
+def simulation_response(name):
+    """Response fetched for a simulation, re-raising its request error"""
+    response = simulation_responses[name]
+    if isinstance(response, Exception):
+        raise response
+    return response
+
+
+simulation_responses = {}
+if packages_ok:
+    with ThreadPoolExecutor(max_workers=len(SIMULATION_PAYLOADS)) as executor:
+        simulation_responses = dict(zip(
+            SIMULATION_PAYLOADS,
+            executor.map(post_simulation, SIMULATION_PAYLOADS.values())
+        ))
+
 # Test 2: Infinite Well Simulation
 print("\n[TEST 2] Infinite Well Simulation")
 print("-" * 70)
 try:
     if packages_ok:
-        payload = {
-            "type": "infinite-well",
-            "parameters": {
-                "width": 5.0,
-                "num_states": 3
-            }
-        }
+        payload = SIMULATION_PAYLOADS["infinite-well"]
         print(f"Request payload: {json.dumps(payload, indent=2)}")
         
-        response = requests.post(f"{API_BASE}/full-simulation", json=payload, timeout=10)
+        response = simulation_response("infinite-well")
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Simulation successful")
@@ -91,15 +159,7 @@ print("\n[TEST 3] Harmonic Oscillator Simulation")
 print("-" * 70)
 try:
     if packages_ok:
-        payload = {
-            "type": "harmonic",
-            "parameters": {
-                "mass": 1.0,
-                "omega": 1.0,
-                "num_states": 3
-            }
-        }
-        response = requests.post(f"{API_BASE}/full-simulation", json=payload, timeout=10)
+        response = simulation_response("harmonic")
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Simulation successful")
@@ -126,15 +186,7 @@ print("\n[TEST 4] Finite Well Simulation")
 print("-" * 70)
 try:
     if packages_ok:
-        payload = {
-            "type": "finite-well",
-            "parameters": {
-                "width": 5.0,
-                "height": 50.0,
-                "num_states": 3
-            }
-        }
-        response = requests.post(f"{API_BASE}/full-simulation", json=payload, timeout=10)
+        response = simulation_response("finite-well")
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Simulation successful")
@@ -163,17 +215,7 @@ print("\n[TEST 5] Quantum Tunneling Simulation")
 print("-" * 70)
 try:
     if packages_ok:
-        payload = {
-            "type": "tunneling",
-            "parameters": {
-                "barrier_height": 30.0,
-                "barrier_width": 2.0,
-                "particle_energy": 20.0,
-                "packet_sigma": 0.5,
-                "duration": 100
-            }
-        }
-        response = requests.post(f"{API_BASE}/full-simulation", json=payload, timeout=10)
+        response = simulation_response("tunneling")
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Simulation successful")
@@ -204,7 +246,7 @@ try:
             "webhook_url": "https://example.com/webhook",
             "metadata": {"test": True}
         }
-        response = requests.post(f"{API_BASE}/webhooks/register", json=payload, timeout=5)
+        response = session.post(f"{API_BASE}/webhooks/register", json=payload, timeout=5)
         if response.status_code == 200:
             print(f"✅ Webhook registered")
             print(f"   Event type: {payload['event_type']}")
@@ -213,7 +255,7 @@ try:
             print(f"⚠️  Webhook registration response: {response.status_code}")
         
         # List
-        response = requests.get(f"{API_BASE}/webhooks/list", timeout=5)
+        response = session.get(f"{API_BASE}/webhooks/list", timeout=5)
         if response.status_code == 200:
             webhooks = response.json()
             print(f"✅ Webhooks listed")
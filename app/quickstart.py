@@ -3,12 +3,16 @@
 Quick Start Script - Run this to test the entire system
 """
 
+import importlib.util
 import subprocess
 import sys
 import os
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 class Colors:
@@ -49,18 +53,24 @@ def check_dependencies():
     """Check required Python packages"""
     print_header("Checking Dependencies")
     
-    required = [
-        'flask', 'numpy', 'scipy', 'flask_cors', 'flask_socketio', 'requests'
-    ]
+    # Module name -> pip distribution name
+    required = {
+        'flask': 'flask',
+        'numpy': 'numpy',
+        'scipy': 'scipy',
+        'flask_cors': 'flask-cors',
+        'flask_socketio': 'flask-socketio',
+        'requests': 'requests'
+    }
     
+    # find_spec only locates each module; nothing is imported
     missing = []
-    for package in required:
-        try:
-            __import__(package)
+    for package, dist in required.items():
+        if importlib.util.find_spec(package) is not None:
             print_status(f"{package}", 'success')
-        except ImportError:
+        else:
             print_status(f"{package} (not installed)", 'error')
-            missing.append(package)
+            missing.append(dist)
     
     if missing:
         print_status(f"\nInstall missing: pip install {' '.join(missing)}", 'warning')
@@ -68,13 +78,22 @@ def check_dependencies():
     
     return True
 
+# One pooled session for every check; transient 502-504s are retried
+session = requests.Session()
+_adapter = HTTPAdapter(max_retries=Retry(
+    total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504],
+    allowed_methods=None, raise_on_status=False
+))
+session.mount('http://', _adapter)
+session.mount('https://', _adapter)
+
 def test_api_endpoint(url, data=None):
     """Test an API endpoint"""
     try:
         if data:
-            response = requests.post(url, json=data, timeout=5)
+            response = session.post(url, json=data, timeout=5)
         else:
-            response = requests.get(url, timeout=5)
+            response = session.get(url, timeout=5)
         
         if response.status_code == 200:
             return True, response.json()
@@ -99,20 +118,57 @@ def test_server_connection():
         print_status("Start server with: python app/api/enhanced_api.py", 'warning')
         return False
 
-def test_infinite_well():
-    """Test infinite well simulation"""
-    print_header("Testing Infinite Well Simulation")
-    
-    url = "http://localhost:5000/api/full-simulation"
-    data = {
+SIMULATION_URL = "http://localhost:5000/api/full-simulation"
+SIMULATION_PAYLOADS = {
+    'infinite_well': {
         "type": "infinite-well",
         "parameters": {
             "width": 5.0,
             "num_states": 3
         }
+    },
+    'finite_well': {
+        "type": "finite-well",
+        "parameters": {
+            "width": 4.0,
+            "height": 40.0,
+            "num_states": 3
+        }
+    },
+    'tunneling': {
+        "type": "tunneling",
+        "parameters": {
+            "barrier_height": 30.0,
+            "barrier_width": 2.0,
+            "particle_energy": 20.0,
+            "packet_sigma": 0.5,
+            "duration": 100
+        }
+    },
+    'harmonic': {
+        "type": "harmonic",
+        "parameters": {
+            "mass": 1.0,
+            "omega": 1.0,
+            "num_states": 3
+        }
     }
+}
+
+def fetch_simulations():
+    """Run all simulation requests concurrently; returns name -> (success, result)"""
+    with ThreadPoolExecutor(max_workers=len(SIMULATION_PAYLOADS)) as executor:
+        responses = executor.map(
+            lambda data: test_api_endpoint(SIMULATION_URL, data),
+            SIMULATION_PAYLOADS.values()
+        )
+        return dict(zip(SIMULATION_PAYLOADS, responses))
+
+def test_infinite_well(response=None):
+    """Test infinite well simulation"""
+    print_header("Testing Infinite Well Simulation")
     
-    success, result = test_api_endpoint(url, data)
+    success, result = response or test_api_endpoint(SIMULATION_URL, SIMULATION_PAYLOADS['infinite_well'])
     
     if success:
         print_status("Simulation ran successfully", 'success')
@@ -124,21 +180,11 @@ def test_infinite_well():
         print_status(f"Simulation failed: {result}", 'error')
         return False
 
-def test_finite_well():
+def test_finite_well(response=None):
     """Test finite well simulation"""
     print_header("Testing Finite Well Simulation")
     
-    url = "http://localhost:5000/api/full-simulation"
-    data = {
-        "type": "finite-well",
-        "parameters": {
-            "width": 4.0,
-            "height": 40.0,
-            "num_states": 3
-        }
-    }
-    
-    success, result = test_api_endpoint(url, data)
+    success, result = response or test_api_endpoint(SIMULATION_URL, SIMULATION_PAYLOADS['finite_well'])
     
     if success:
         print_status("Simulation ran successfully", 'success')
@@ -150,23 +196,11 @@ def test_finite_well():
         print_status(f"Simulation failed: {result}", 'error')
         return False
 
-def test_tunneling():
+def test_tunneling(response=None):
     """Test tunneling simulation"""
     print_header("Testing Tunneling Simulation")
     
-    url = "http://localhost:5000/api/full-simulation"
-    data = {
-        "type": "tunneling",
-        "parameters": {
-            "barrier_height": 30.0,
-            "barrier_width": 2.0,
-            "particle_energy": 20.0,
-            "packet_sigma": 0.5,
-            "duration": 100
-        }
-    }
-    
-    success, result = test_api_endpoint(url, data)
+    success, result = response or test_api_endpoint(SIMULATION_URL, SIMULATION_PAYLOADS['tunneling'])
     
     if success:
         print_status("Simulation ran successfully", 'success')
@@ -178,21 +212,11 @@ def test_tunneling():
         print_status(f"Simulation failed: {result}", 'error')
         return False
 
-def test_harmonic_oscillator():
+def test_harmonic_oscillator(response=None):
     """Test harmonic oscillator"""
     print_header("Testing Harmonic Oscillator")
     
-    url = "http://localhost:5000/api/full-simulation"
-    data = {
-        "type": "harmonic",
-        "parameters": {
-            "mass": 1.0,
-            "omega": 1.0,
-            "num_states": 3
-        }
-    }
-    
-    success, result = test_api_endpoint(url, data)
+    success, result = response or test_api_endpoint(SIMULATION_URL, SIMULATION_PAYLOADS['harmonic'])
     
     if success:
         print_status("Simulation ran successfully", 'success')
@@ -244,11 +268,13 @@ def run_all_tests():
         print_status("\nCannot run simulation tests without server", 'warning')
         return results
     
-    # Test simulations
-    results['infinite_well'] = test_infinite_well()
-    results['finite_well'] = test_finite_well()
-    results['tunneling'] = test_tunneling()
-    results['harmonic'] = test_harmonic_oscillator()
+    # Test simulations: the requests are independent, so they run
+    # concurrently and are then reported one by one
+    responses = fetch_simulations()
+    results['infinite_well'] = test_infinite_well(responses['infinite_well'])
+    results['finite_well'] = test_finite_well(responses['finite_well'])
+    results['tunneling'] = test_tunneling(responses['tunneling'])
+    results['harmonic'] = test_harmonic_oscillator(responses['harmonic'])
     results['webhooks'] = test_webhooks()
     
     return results
@@ -4,6 +4,7 @@ Backend startup script with correct Python path
 This script ensures the quantum_playground module is importable
 """
 
+import argparse
 import sys
 from pathlib import Path
 
@@ -12,14 +13,41 @@ workspace_root = Path(__file__).parent
 src_path = workspace_root / 'src'
 sys.path.insert(0, str(src_path))
 
-# Now run the Flask app
-if __name__ == '__main__':
-    # Import and run the app
+
+def main():
+    parser = argparse.ArgumentParser(description="Start the quantum simulator backend API")
+    parser.add_argument('--host', default='0.0.0.0', help="Interface to bind (default: 0.0.0.0)")
+    parser.add_argument('--port', type=int, default=5000, help="Port to listen on (default: 5000)")
+    parser.add_argument('--debug', action='store_true', help="Run Flask in debug mode")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="Check the path wiring and exit without importing Flask")
+    args = parser.parse_args()
+
+    if args.dry_run:
+        # Only the files are checked, so this stays fast and works without
+        # the backend requirements installed
+        required = [
+            src_path / 'quantum_playground' / '__init__.py',
+            workspace_root / 'app' / 'backend' / 'app' / 'api' / 'enhanced_api.py',
+        ]
+        missing = [path for path in required if not path.is_file()]
+        print(f"📍 Python path includes: {src_path}")
+        for path in missing:
+            print(f"❌ Missing: {path}")
+        return 1 if missing else 0
+
+    # Import and run the app (Flask, Socket.IO and the solvers load here)
     from app.backend.app.api.enhanced_api import app, socketio
-    
+
     print(f"📍 Python path includes: {src_path}")
     print(f"🚀 Starting Backend API...")
-    print(f"📌 Running on http://0.0.0.0:5000")
-    print(f"💡 Make sure to forward port 5000 in GitHub Codespace settings")
-    
-    socketio.run(app, host='0.0.0.0', port=5000, debug=False)
+    print(f"📌 Running on http://{args.host}:{args.port}")
+    print(f"💡 Make sure to forward port {args.port} in GitHub Codespace settings")
+
+    socketio.run(app, host=args.host, port=args.port, debug=args.debug)
+    return 0
+
+
+# Now run the Flask app
+if __name__ == '__main__':
+    sys.exit(main())
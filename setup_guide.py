@@ -9,6 +9,7 @@ import sys
 import os
 import subprocess
 import time
+import importlib.util
 from pathlib import Path
 
 # Color codes for output
@@ -73,10 +74,9 @@ def verify_packages():
     
     missing = []
     for module, name in required_packages.items():
-        try:
-            __import__(module)
+        if importlib.util.find_spec(module) is not None:
             print_success(f"{name}")
-        except ImportError:
+        else:
             print_error(f"{name}")
             missing.append(name)
     
@@ -16,7 +16,7 @@ from matplotlib.colors import LogNorm
 import os
 
 from quantum_playground.potentials import FiniteSquareWell, InfiniteSquareWell
-from quantum_playground.solvers import QuantumGrid, StationarySolver
+from quantum_playground.solvers import QuantumGrid, StationarySolver, abs2
 
 
 class FiniteWellSimulation:
@@ -143,10 +143,10 @@ class FiniteWellSimulation:
         ax3 = fig.add_subplot(gs[1, 0])
         for i in range(min(3, self.num_levels)):
             psi = self.eigenvectors[:, i]
-            prob = np.abs(psi) ** 2
+            prob = abs2(psi)
             ax3.plot(self.x, prob, linewidth=2, label=f"n={i+1}")
 
-        ax3.fill_between(self.x, 0, self.potential / self.barrier_height * np.max(np.abs(self.eigenvectors)**2),
+        ax3.fill_between(self.x, 0, self.potential / self.barrier_height * np.max(abs2(self.eigenvectors)),
                         alpha=0.1, color="gray")
         ax3.set_xlabel("Position x", fontsize=11)
         ax3.set_ylabel("|ψ(x)|²", fontsize=11)
@@ -158,7 +158,7 @@ class FiniteWellSimulation:
         ax4 = fig.add_subplot(gs[1, 1])
         for i in range(min(3, self.num_levels)):
             psi = self.eigenvectors_inf[:, i]
-            prob = np.abs(psi) ** 2
+            prob = abs2(psi)
             ax4.plot(self.x, prob, linewidth=2, label=f"n={i+1}")
 
         center = (self.x[0] + self.x[-1]) / 2
@@ -174,7 +174,7 @@ class FiniteWellSimulation:
         ax5 = fig.add_subplot(gs[1, 2])
         for i in range(min(4, self.num_levels)):
             psi = self.eigenvectors[:, i]
-            prob = np.abs(psi) ** 2
+            prob = abs2(psi)
 
             # Find penetration depth (where probability drops to 1/e)
             right_edge = center + half_width
@@ -200,7 +200,7 @@ class FiniteWellSimulation:
         ax6 = fig.add_subplot(gs[2, :2])
         for i in range(min(2, self.num_levels)):
             psi = self.eigenvectors[:, i]
-            prob = np.abs(psi) ** 2
+            prob = abs2(psi)
             prob_safe = np.maximum(prob, 1e-8)
             ax6.semilogy(self.x, prob_safe, linewidth=2, label=f"n={i+1}")
 
@@ -251,7 +251,7 @@ class FiniteWellSimulation:
         fig, axes = plt.subplots(1, 2, figsize=(14, 5))
 
         psi = self.eigenvectors[:, state_index]
-        prob = np.abs(psi) ** 2
+        prob = abs2(psi)
         E = self.eigenvalues[state_index]
 
         # Left plot: linear scale
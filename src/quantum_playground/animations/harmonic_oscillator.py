@@ -17,7 +17,7 @@ from scipy.special import hermite, factorial
 import os
 
 from quantum_playground.potentials import HarmonicOscillator
-from quantum_playground.solvers import QuantumGrid, StationarySolver, GaussianWavePacket, TimeDependentSolver
+from quantum_playground.solvers import QuantumGrid, StationarySolver, GaussianWavePacket, TimeDependentSolver, abs2
 
 
 class HarmonicOscillatorSimulation:
@@ -117,7 +117,7 @@ class HarmonicOscillatorSimulation:
         for i in range(min(4, self.num_levels)):
             E = self.eigenvalues[i]
             psi = self.eigenvectors[:, i]
-            prob = np.abs(psi) ** 2
+            prob = abs2(psi)
 
             # Normalize for visualization
             prob_vis = prob / np.max(prob) * 0.3 + E
@@ -151,7 +151,7 @@ class HarmonicOscillatorSimulation:
         # 3. Probability densities
         ax3 = fig.add_subplot(gs[1, 0])
         for i in range(min(5, self.num_levels)):
-            prob = np.abs(self.eigenvectors[:, i]) ** 2
+            prob = abs2(self.eigenvectors[:, i])
             ax3.plot(self.x, prob, linewidth=2, label=f"n={i}")
 
         ax3.set_xlabel("Position x", fontsize=11)
@@ -233,7 +233,7 @@ class HarmonicOscillatorSimulation:
         rho_classical /= np.trapz(rho_classical, self.x)
 
         # Quantum probability
-        prob_quantum = np.abs(self.eigenvectors[:, n_display]) ** 2
+        prob_quantum = abs2(self.eigenvectors[:, n_display])
         prob_quantum /= np.trapz(prob_quantum, self.x)
 
         ax7.plot(self.x, prob_quantum, "b-", linewidth=2.5, label="Quantum |ψ₀|²")
@@ -278,12 +278,14 @@ class HarmonicOscillatorSimulation:
 
         fig, axes = plt.subplots(1, 3, figsize=(15, 4))
 
-        # Precompute superposition
-        psi_super = np.zeros(len(self.x), dtype=complex)
-        for n in range(min(len(coefficients), self.num_levels)):
-            psi_super += coefficients[n] * self.eigenvectors[:, n]
+        # Precompute superposition as one matrix-vector product over the states
+        num_terms = min(len(coefficients), self.num_levels)
+        basis = self.eigenvectors[:, :num_terms]
+        amplitudes = np.asarray(coefficients[:num_terms], dtype=complex)
+        energies = self.eigenvalues[:num_terms]
+        psi_super = basis @ amplitudes
 
-        prob_super = np.abs(psi_super) ** 2
+        prob_super = abs2(psi_super)
 
         # Plots
         (line_real,) = axes[0].plot([], [], "b-", linewidth=2)
@@ -315,7 +317,7 @@ class HarmonicOscillatorSimulation:
 
         # Bar plot for components
         bars = axes[2].bar(range(min(len(coefficients), self.num_levels)),
-                          np.abs(coefficients[:self.num_levels]) ** 2,
+                          abs2(amplitudes),
                           color=plt.cm.Spectral(np.linspace(0, 1, min(len(coefficients), self.num_levels))),
                           alpha=0.7)
 
@@ -324,13 +326,10 @@ class HarmonicOscillatorSimulation:
         def animate(frame):
             t = frame / num_frames * 2 * np.pi
 
-            # Time-dependent phase
-            psi_t = np.zeros(len(self.x), dtype=complex)
-            for n in range(min(len(coefficients), self.num_levels)):
-                E_n = self.eigenvalues[n]
-                psi_t += coefficients[n] * self.eigenvectors[:, n] * np.exp(-1j * E_n * t)
+            # Time-dependent phase: ψ(t) = Σ c_n e^{-i E_n t} ψ_n in one matmul
+            psi_t = basis @ (amplitudes * np.exp(-1j * energies * t))
 
-            prob_t = np.abs(psi_t) ** 2
+            prob_t = abs2(psi_t)
 
             line_real.set_data(self.x, np.real(psi_t))
             line_imag.set_data(self.x, np.imag(psi_t))
@@ -66,12 +66,13 @@ class InfiniteWellSimulation:
         """Create smooth confining potential that approximates infinite well."""
         well_center = (self.x[0] + self.x[-1]) / 2
         half_width = self.well_width / 2
-        distance_from_center = np.abs(self.x - well_center)
-
-        # Smooth potential that rises steeply outside well
-        V = np.zeros_like(self.x)
-        outside_well = distance_from_center > half_width
-        V[outside_well] = 50.0 * (distance_from_center[outside_well] - half_width) ** 2
+        # Smooth potential that rises steeply outside well:
+        # V = 50 * max(|x - x_c| - L/2, 0)², built in place without masks
+        V = np.abs(self.x - well_center)
+        V -= half_width
+        np.maximum(V, 0.0, out=V)
+        np.square(V, out=V)
+        V *= 50.0
 
         return V
 
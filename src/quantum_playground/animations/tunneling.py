@@ -22,6 +22,7 @@ from quantum_playground.solvers import (
     StationarySolver,
     GaussianWavePacket,
     TimeDependentSolver,
+    abs2,
 )
 
 
@@ -137,7 +138,7 @@ class TunnelingSimulation:
 
         # Final wavefunction
         psi_final = trajectory[:, -1]
-        prob_final = np.abs(psi_final) ** 2
+        prob_final = abs2(psi_final)
 
         # Transmitted: probability to the right of barrier
         prob_transmitted = np.sum(prob_final[barrier_right:]) * self.dx
@@ -149,7 +150,7 @@ class TunnelingSimulation:
         prob_inside = np.sum(prob_final[barrier_left:barrier_right]) * self.dx
 
         # Initial total probability
-        prob_init = np.sum(np.abs(self.psi_init) ** 2) * self.dx
+        prob_init = np.sum(abs2(self.psi_init)) * self.dx
 
         T = prob_transmitted / (prob_init + 1e-10)
         R = prob_reflected / (prob_init + 1e-10)
@@ -214,7 +215,7 @@ class TunnelingSimulation:
 
         # 3. Initial wavefunction
         ax3 = fig.add_subplot(gs[1, 0])
-        prob_init = np.abs(self.psi_init) ** 2
+        prob_init = abs2(self.psi_init)
         ax3.fill_between(self.x, 0, prob_init, alpha=0.3, color="blue")
         ax3.plot(self.x, prob_init, "b-", linewidth=2)
         ax3.set_xlabel("Position x", fontsize=11)
@@ -225,7 +226,7 @@ class TunnelingSimulation:
         # 4. Final wavefunction
         ax4 = fig.add_subplot(gs[1, 1])
         psi_final = trajectory[:, -1]
-        prob_final = np.abs(psi_final) ** 2
+        prob_final = abs2(psi_final)
         ax4.fill_between(self.x, 0, prob_final, alpha=0.3, color="green")
         ax4.plot(self.x, prob_final, "g-", linewidth=2)
         ax4.fill_between(self.x, 0, self.potential / self.barrier_height * np.max(prob_final),
@@ -254,7 +255,7 @@ class TunnelingSimulation:
 
         # Downsample trajectory for visualization
         time_indices = np.linspace(0, trajectory.shape[1] - 1, 100, dtype=int)
-        prob_traj = np.abs(trajectory[:, time_indices]) ** 2
+        prob_traj = abs2(trajectory[:, time_indices])
 
         im = ax6.pcolormesh(self.x, range(len(time_indices)), prob_traj.T, shading="auto", cmap="hot")
         ax6.axvline(self.barrier_position - self.barrier_width / 2, color="cyan", linestyle="--", linewidth=1.5, alpha=0.7)
@@ -276,7 +277,7 @@ class TunnelingSimulation:
         barrier_right = min(len(self.x), barrier_center_idx + barrier_half_width_idx)
 
         prob_inside_time = [
-            np.sum(np.abs(trajectory[barrier_left:barrier_right, t]) ** 2) * self.dx
+            np.sum(abs2(trajectory[barrier_left:barrier_right, t])) * self.dx
             for t in range(trajectory.shape[1])
         ]
 
@@ -373,7 +374,7 @@ class TunnelingSimulation:
         fill_prob = ax_prob.fill_between([], [], alpha=0.3, color="red")
         ax_prob.fill_between(self.x, 0, self.potential / self.barrier_height * 0.5, alpha=0.15, color="orange")
         ax_prob.set_xlim(self.x[0], self.x[-1])
-        ax_prob.set_ylim(0, np.max(np.abs(trajectory) ** 2) * 1.3)
+        ax_prob.set_ylim(0, np.max(abs2(trajectory)) * 1.3)
         ax_prob.set_ylabel("|ψ(x)|²", fontsize=11)
         ax_prob.set_title("Probability Density", fontsize=12, fontweight="bold")
         ax_prob.grid(True, alpha=0.3)
@@ -409,7 +410,7 @@ class TunnelingSimulation:
             line_imag.set_data(self.x, np.imag(psi))
 
             # Probability
-            prob = np.abs(psi) ** 2
+            prob = abs2(psi)
             line_prob.set_data(self.x, prob)
 
             # Update fill
@@ -418,7 +419,7 @@ class TunnelingSimulation:
             ax_prob.plot(self.x, prob, "r-", linewidth=2.5)
             ax_prob.fill_between(self.x, 0, self.potential / self.barrier_height * 0.5, alpha=0.15, color="orange", label="Barrier")
             ax_prob.set_xlim(self.x[0], self.x[-1])
-            ax_prob.set_ylim(0, np.max(np.abs(trajectory) ** 2) * 1.3)
+            ax_prob.set_ylim(0, np.max(abs2(trajectory)) * 1.3)
             ax_prob.set_ylabel("|ψ(x)|²", fontsize=11)
             ax_prob.set_title("Probability Density", fontsize=12, fontweight="bold")
             ax_prob.legend(fontsize=9)
@@ -41,9 +41,8 @@ class InfiniteSquareWell(Potential):
     
     def __call__(self, x: np.ndarray) -> np.ndarray:
         """Return 0 inside the well, large value outside."""
-        V = np.zeros_like(x, dtype=float)
-        V[(x < self.left) | (x > self.right)] = 1e10  # Effectively infinite
-        return V
+        outside = (x < self.left) | (x > self.right)
+        return np.where(outside, 1e10, 0.0)  # Effectively infinite
     
     def name(self) -> str:
         return f"Infinite Square Well (L={self.width})"
@@ -71,10 +70,8 @@ class FiniteSquareWell(Potential):
     
     def __call__(self, x: np.ndarray) -> np.ndarray:
         """Return 0 inside the well, V0 outside."""
-        V = np.full_like(x, self.height, dtype=float)
-        mask = (x >= self.left) & (x <= self.right)
-        V[mask] = 0
-        return V
+        inside = (x >= self.left) & (x <= self.right)
+        return np.where(inside, 0.0, float(self.height))
     
     def name(self) -> str:
         return f"Finite Square Well (L={self.width}, V0={self.height})"
@@ -103,10 +100,8 @@ class RectangularBarrier(Potential):
     
     def __call__(self, x: np.ndarray) -> np.ndarray:
         """Return V0 inside the barrier, 0 outside."""
-        V = np.zeros_like(x, dtype=float)
-        mask = (x >= self.left) & (x <= self.right)
-        V[mask] = self.height
-        return V
+        inside = (x >= self.left) & (x <= self.right)
+        return np.where(inside, float(self.height), 0.0)
     
     def name(self) -> str:
         return f"Rectangular Barrier (V0={self.height}, width={self.width})"
@@ -160,11 +155,12 @@ class PiecewisePotential(Potential):
     
     def __call__(self, x: np.ndarray) -> np.ndarray:
         """Evaluate piecewise potential."""
-        V = np.zeros_like(x, dtype=float)
-        for left, right, value in self.regions:
-            mask = (x >= left) & (x <= right)
-            V[mask] = value
-        return V
+        if not self.regions:
+            return np.zeros_like(x, dtype=float)
+        # Where regions overlap, np.piecewise keeps the last matching one
+        condlist = [(x >= left) & (x <= right) for left, right, _ in self.regions]
+        values = [float(value) for _, _, value in self.regions]
+        return np.piecewise(np.asarray(x, dtype=float), condlist, values)
     
     def name(self) -> str:
         return "Piecewise Potential"
@@ -0,0 +1,107 @@
+"""
+Tests for the backend simulation API (Flask test client, no server needed).
+
+Run with: python tests/test_api.py
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add the backend package to path; Socket.IO runs in plain threading mode
+sys.path.insert(0, str(Path(__file__).parent.parent / "app" / "backend"))
+os.environ.setdefault("SOCKETIO_ASYNC_MODE", "threading")
+
+from app.api import enhanced_api
+
+
+def test_full_simulation_batch():
+    """Test the batch endpoint: ordered results and 400 on malformed bodies."""
+    print("Testing /api/full-simulation-batch...", end=" ")
+    client = enhanced_api.app.test_client()
+    
+    simulations = [
+        {"type": "harmonic", "parameters": {"omega": 1.0, "num_states": 2}},
+        {"type": "infinite-well", "parameters": {"width": 4.0, "num_states": 3}},
+        {"type": "finite-well", "parameters": {"width": 4.0, "height": 40.0, "num_states": 4}},
+    ]
+    response = client.post("/api/full-simulation-batch", json={"simulations": simulations})
+    assert response.status_code == 200
+    results = response.get_json()["results"]
+    
+    # One result per simulation, in request order
+    assert [r["simulation_type"] for r in results] == ["harmonic-oscillator", "infinite-well", "finite-well"]
+    assert [len(r["wavefunctions"]) for r in results] == [2, 3, 4]
+    
+    # Same answer as the single-simulation endpoint
+    single = client.post("/api/full-simulation", json=simulations[1]).get_json()
+    assert single["energy_levels"] == results[1]["energy_levels"]
+    
+    for body in ({"simulations": []}, {"simulations": "infinite-well"}, [simulations[0]], {}):
+        response = client.post("/api/full-simulation-batch", json=body)
+        assert response.status_code == 400, body
+        assert "error" in response.get_json()
+    
+    print("✓")
+
+
+def test_solver_caches():
+    """Test that repeated parameters hit the solver caches and entries are read-only."""
+    print("Testing cached eigensolves...", end=" ")
+    
+    cached_calls = [
+        (enhanced_api._cached_infinite_well, (3.25, 3)),
+        (enhanced_api._cached_finite_well, (3.25, 35.0, 3)),
+        (enhanced_api._cached_harmonic, (1.0, 1.25, 3)),
+        (enhanced_api._cached_barrier, (25.0, 1.25)),
+    ]
+    
+    for cached, args in cached_calls:
+        first = cached(*args)
+        hits = cached.cache_info().hits
+        second = cached(*args)
+        assert cached.cache_info().hits == hits + 1, cached.__name__
+        # A hit hands back the very same arrays...
+        assert all(a is b for a, b in zip(first, second))
+        # ...which must not be writable, or one request could corrupt another
+        for arr in second:
+            try:
+                arr[0] = 0
+            except ValueError:
+                continue
+            raise AssertionError(f"{cached.__name__} returned a writable array")
+    
+    print("✓")
+
+
+def main():
+    """Run all tests."""
+    print("\n" + "=" * 60)
+    print("SIMULATION API TESTS")
+    print("=" * 60 + "\n")
+    
+    tests = [
+        test_full_simulation_batch,
+        test_solver_caches,
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except Exception as e:
+            print(f"✗ FAILED: {e}")
+            failed += 1
+    
+    print("\n" + "=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60 + "\n")
+    
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,7 +11,7 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from quantum_playground.solvers import QuantumGrid, StationarySolver, GaussianWavePacket
+from quantum_playground.solvers import QuantumGrid, StationarySolver, TimeDependentSolver, GaussianWavePacket
 from quantum_playground.potentials import InfiniteSquareWell, HarmonicOscillator
 
 
@@ -145,6 +145,32 @@ def test_wavefunction_orthonormality():
     print("✓")
 
 
+def test_split_operator_evolution():
+    """Test split-operator evolution against Crank-Nicolson for a free packet."""
+    print("Testing split-operator evolution...", end=" ")
+    
+    grid = QuantumGrid(-15, 15, 1024)
+    V = np.zeros_like(grid.x)
+    psi0 = GaussianWavePacket.create(grid.x, x0=-5.0, sigma=1.0, k0=2.0)
+    psi0 = GaussianWavePacket.normalize(psi0, grid.dx)
+    
+    centers = {}
+    for method in TimeDependentSolver.METHODS:
+        solver = TimeDependentSolver(grid, V, mass=1.0, dt=0.01, method=method)
+        trajectory = solver.evolve(psi0, 201, sample_every=200)
+        prob = np.abs(trajectory[:, -1])**2
+        
+        # Unitary: norm is conserved
+        assert np.isclose(np.sum(prob) * grid.dx, 1.0, atol=1e-8), f"{method} lost norm"
+        centers[method] = np.sum(grid.x * prob) * grid.dx
+    
+    # Packet moves at group velocity k0/m = 2 for t = 2
+    for method, center in centers.items():
+        assert np.isclose(center, -1.0, atol=0.05), f"{method}: <x> = {center}"
+    
+    print("✓")
+
+
 def main():
     """Run all tests."""
     print("\n" + "=" * 60)
@@ -158,6 +184,7 @@ def main():
         test_gaussian_packet,
         test_potential_classes,
         test_wavefunction_orthonormality,
+        test_split_operator_evolution,
     ]
     
     passed = 0
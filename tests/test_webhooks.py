@@ -0,0 +1,295 @@
+"""
+Tests for the backend webhook registry (batching, circuit breakers, queue bounds).
+
+Run with: python tests/test_webhooks.py
+"""
+
+import sys
+import threading
+import time
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+import orjson
+import requests
+
+# Add the backend package to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "app" / "backend"))
+
+from app.webhooks import webhook_manager
+from app.webhooks.webhook_manager import WebhookRegistry, WebhookEvent
+
+
+FIXED_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+class _FixedDatetime(datetime):
+    """datetime whose now() is FIXED_NOW, so encoded bodies are exact"""
+    
+    @classmethod
+    def now(cls, tz=None):
+        return FIXED_NOW
+
+
+class _Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class _StubSession:
+    """Records every POST instead of sending it"""
+    
+    def __init__(self):
+        self.posts = []
+    
+    def post(self, url, data=None, headers=None, timeout=None):
+        self.posts.append((url, data, headers))
+        return _Response(200)
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_batched_delivery():
+    """Test one POST per URL per batch, with bodies shared across subscribers."""
+    print("Testing batched webhook delivery...", end=" ")
+    
+    webhook_manager.datetime = _FixedDatetime
+    try:
+        registry = WebhookRegistry(http2=False)
+        session = registry._session = _StubSession()
+    
+        for url in ("http://a.test/hook", "http://b.test/hook"):
+            registry.register(WebhookEvent.SIMULATION_COMPLETE, url)
+            registry.register(WebhookEvent.ENERGY_CALCULATED, url)
+        registry.register(WebhookEvent.ENERGY_CALCULATED, "http://c.test/hook")
+    
+        # Holding the queue's lock keeps the event thread from draining until
+        # all three events are queued, so they form a single batch
+        with registry._cv:
+            registry.trigger(WebhookEvent.SIMULATION_COMPLETE, {"run": 1})
+            registry.trigger(WebhookEvent.ENERGY_CALCULATED, {"energies": [0.5, 1.5]})
+            registry.trigger(WebhookEvent.SIMULATION_COMPLETE, {"run": 2})
+    
+        assert _wait_for(lambda: len(session.posts) >= 3)
+        time.sleep(0.1)  # any extra POST would show up here
+    finally:
+        webhook_manager.datetime = datetime
+    
+    posts = {url: (body, headers) for url, body, headers in session.posts}
+    assert len(session.posts) == 3
+    assert set(posts) == {"http://a.test/hook", "http://b.test/hook", "http://c.test/hook"}
+    
+    now_iso = FIXED_NOW.isoformat()
+    batch_body = orjson.dumps({
+        "event": "batch",
+        "timestamp": now_iso,
+        "batch": [
+            {"event": "simulation.complete", "timestamp": now_iso, "data": {"run": 1}},
+            {"event": "energy.calculated", "timestamp": now_iso, "data": {"energies": [0.5, 1.5]}},
+            {"event": "simulation.complete", "timestamp": now_iso, "data": {"run": 2}},
+        ],
+    })
+    single_body = orjson.dumps({
+        "event": "energy.calculated",
+        "timestamp": now_iso,
+        "data": {"energies": [0.5, 1.5]},
+    })
+    
+    body_a, headers_a = posts["http://a.test/hook"]
+    body_b, _ = posts["http://b.test/hook"]
+    body_c, headers_c = posts["http://c.test/hook"]
+    assert body_a == batch_body
+    # Same events -> the encoded body is built once and shared
+    assert body_a is body_b
+    assert headers_a["X-Webhook-Event"] == "batch"
+    assert headers_a["X-Webhook-Batch-Size"] == "3"
+    assert body_c == single_body
+    assert headers_c["X-Webhook-Event"] == "energy.calculated"
+    assert headers_c["X-Webhook-Batch-Size"] == "1"
+    
+    print("✓")
+
+
+def test_unserializable_payload():
+    """Test that an unencodable payload only drops itself, not the rest of the batch."""
+    print("Testing unserializable webhook payload...", end=" ")
+    
+    registry = WebhookRegistry(http2=False)
+    session = registry._session = _StubSession()
+    registry.register(WebhookEvent.SIMULATION_COMPLETE, "http://a.test/hook")
+    registry.register(WebhookEvent.ENERGY_CALCULATED, "http://b.test/hook")
+    registry.register(WebhookEvent.ENERGY_CALCULATED, "http://a.test/hook")
+    
+    with registry._cv:
+        # orjson cannot encode Decimal
+        registry.trigger(WebhookEvent.SIMULATION_COMPLETE, {"energy": Decimal("0.5")})
+        registry.trigger(WebhookEvent.ENERGY_CALCULATED, {"energies": [0.5, 1.5]})
+    
+    assert _wait_for(lambda: len(session.posts) >= 2)
+    time.sleep(0.1)
+    
+    # Both subscribers still get the valid event, a only loses the bad one
+    posts = {url: orjson.loads(body) for url, body, _ in session.posts}
+    assert len(session.posts) == 2
+    for url in ("http://a.test/hook", "http://b.test/hook"):
+        assert posts[url]["event"] == "energy.calculated"
+        assert posts[url]["data"] == {"energies": [0.5, 1.5]}
+    
+    print("✓")
+
+
+def test_circuit_breaker():
+    """Test CLOSED -> OPEN -> HALF_OPEN -> CLOSED/OPEN breaker transitions."""
+    print("Testing webhook circuit breaker...", end=" ")
+    
+    registry = WebhookRegistry(http2=False, failure_threshold=2, recovery_timeout=0.2)
+    url = "http://flaky.test/hook"
+    delivery = registry._encode_delivery(
+        [{'event': WebhookEvent.ERROR_OCCURRED, 'payload': {}, 'timestamp': 't'}], 't'
+    )
+    
+    calls = []
+    trial_blocks = []
+    outcome = {'ok': False}
+    
+    def stub_post(webhook_url, delivery):
+        # Breaker state seen while the request is in flight
+        calls.append(registry._breakers.get(webhook_url, {}).get('state', 'CLOSED'))
+        if calls[-1] == 'HALF_OPEN':
+            # Only the one trial may run; anything else is still turned away
+            trial_blocks.append(not registry._breaker_allows(webhook_url))
+        if not outcome['ok']:
+            raise requests.exceptions.ConnectionError("refused")
+        return _Response(200)
+    
+    registry._post = stub_post
+    state = lambda: registry._breakers[url]['state']
+    
+    # Failures up to the threshold open the breaker
+    registry._dispatch_webhook(url, delivery)
+    assert state() == 'CLOSED'
+    registry._dispatch_webhook(url, delivery)
+    assert state() == 'OPEN'
+    
+    # While OPEN, dispatches are skipped without calling _post
+    registry._dispatch_webhook(url, delivery)
+    assert len(calls) == 2
+    
+    # After the cooldown one trial goes through; a failure reopens at once
+    time.sleep(0.25)
+    registry._dispatch_webhook(url, delivery)
+    assert calls[-1] == 'HALF_OPEN'
+    assert state() == 'OPEN'
+    registry._dispatch_webhook(url, delivery)
+    assert len(calls) == 3
+    
+    # A successful trial closes it again and resets the failure count
+    time.sleep(0.25)
+    outcome['ok'] = True
+    registry._dispatch_webhook(url, delivery)
+    assert calls[3] == 'HALF_OPEN'
+    assert state() == 'CLOSED'
+    assert registry._breakers[url]['failures'] == 0
+    assert trial_blocks == [True, True]
+    registry._dispatch_webhook(url, delivery)
+    assert len(calls) == 5
+    
+    print("✓")
+
+
+class _PausedRegistry(WebhookRegistry):
+    """Registry whose event thread never drains, so the queue only fills"""
+    
+    def _process_events(self):
+        pass
+
+
+def test_bounded_queue_drops():
+    """Test that a full queue drops low-priority events but keeps high-priority ones."""
+    print("Testing bounded webhook queue...", end=" ")
+    
+    registry = _PausedRegistry(http2=False, max_queue=5)
+    for event in WebhookEvent:
+        registry.register(event, "http://slow.test/hook")
+    
+    for i in range(8):
+        registry.trigger(WebhookEvent.WAVEFUNCTION_UPDATED, {'step': i})
+    assert len(registry.event_queue) == 5
+    assert registry.dropped_count == 3
+    assert [e['payload']['step'] for e in registry.event_queue] == [0, 1, 2, 3, 4]
+    
+    # A high-priority event waits for room: drain one entry shortly after
+    def drain_one():
+        time.sleep(0.1)
+        with registry._cv:
+            registry.event_queue.popleft()
+            registry._cv.notify_all()
+    
+    drainer = threading.Thread(target=drain_one)
+    drainer.start()
+    registry.trigger(WebhookEvent.ERROR_OCCURRED, {'error_message': 'boom'})
+    drainer.join()
+    assert registry.dropped_count == 3
+    assert registry.event_queue[-1]['event'] == WebhookEvent.ERROR_OCCURRED
+    
+    # Full again: low priority is dropped at once...
+    start = time.time()
+    registry.trigger(WebhookEvent.TUNNELING_STARTED, {})
+    assert time.time() - start < webhook_manager.HIGH_PRIORITY_WAIT
+    assert registry.dropped_count == 4
+    
+    # ...and high priority only after waiting HIGH_PRIORITY_WAIT for room
+    start = time.time()
+    registry.trigger(WebhookEvent.SIMULATION_COMPLETE, {})
+    assert time.time() - start >= webhook_manager.HIGH_PRIORITY_WAIT * 0.9
+    assert registry.dropped_count == 5
+    
+    assert [e['event'] for e in registry.event_queue] == (
+        [WebhookEvent.WAVEFUNCTION_UPDATED] * 4 + [WebhookEvent.ERROR_OCCURRED]
+    )
+    assert registry.get_status()['dropped_count'] == 5
+    
+    print("✓")
+
+
+def main():
+    """Run all tests."""
+    print("\n" + "=" * 60)
+    print("WEBHOOK REGISTRY TESTS")
+    print("=" * 60 + "\n")
+    
+    tests = [
+        test_batched_delivery,
+        test_unserializable_payload,
+        test_circuit_breaker,
+        test_bounded_queue_drops,
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except Exception as e:
+            print(f"✗ FAILED: {e}")
+            failed += 1
+    
+    print("\n" + "=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60 + "\n")
+    
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())